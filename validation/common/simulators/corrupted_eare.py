@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
 class CorpusError(ValueError):
@@ -37,6 +37,9 @@ class Corruption:
     reason: Optional[str] = None
 
 
+CorruptionGroups = Tuple[Dict[str, Tuple[Corruption, ...]], Tuple[Corruption, ...]]
+
+
 @dataclass
 class Expectations:
     should_detect: bool
@@ -54,6 +57,8 @@ class Scenario:
     nodes: List[Node]
     corruptions: List[Corruption]
     expectations: Expectations
+    # (targeted, wildcard) grouping of corruptions, precomputed by parse_scenario
+    corruption_groups: Optional[CorruptionGroups] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -171,6 +176,18 @@ def _validate_expectations(data: Any, scenario_id: str) -> Expectations:
     )
 
 
+def _group_corruptions(corruptions: List[Corruption]) -> CorruptionGroups:
+    targeted: Dict[str, List[Corruption]] = {}
+    wildcard: List[Corruption] = []
+    for c in corruptions:
+        target = c.target_node or "*"
+        if target == "*":
+            wildcard.append(c)
+        else:
+            targeted.setdefault(target, []).append(c)
+    return {k: tuple(v) for k, v in targeted.items()}, tuple(wildcard)
+
+
 def parse_scenario(raw: Dict[str, Any]) -> Scenario:
     scenario_id = str(raw.get("scenario_id", "")).strip()
     if not scenario_id:
@@ -187,15 +204,22 @@ def parse_scenario(raw: Dict[str, Any]) -> Scenario:
         nodes=nodes,
         corruptions=corruptions,
         expectations=expectations,
+        corruption_groups=_group_corruptions(corruptions),
     )
 
 
-def load_corpus(path: str) -> List[Scenario]:
+def iter_corpus(path: str) -> Iterator[Scenario]:
+    """Parse the corpus one scenario at a time as the caller reaches it."""
     with open(path, "r", encoding="utf-8") as handle:
         data = json.load(handle)
     if not isinstance(data, list):
         raise CorpusError("corpus root must be an array")
-    return [parse_scenario(entry) for entry in data]
+    for entry in data:
+        yield parse_scenario(entry)
+
+
+def load_corpus(path: str) -> List[Scenario]:
+    return list(iter_corpus(path))
 
 
 def simulate(scenario: Scenario) -> SimulationResult:
@@ -206,12 +230,10 @@ def simulate(scenario: Scenario) -> SimulationResult:
         if code not in errors:
             errors.append(code)
 
-    corruptions_by_target: Dict[str, List[Corruption]] = {}
     for c in scenario.corruptions:
-        target = c.target_node or "*"
-        corruptions_by_target.setdefault(target, []).append(c)
         if c.type.upper() not in _ERROR_CODES:
             notes.append(f"unknown corruption type {c.type}")
+    targeted, wildcard = scenario.corruption_groups or _group_corruptions(scenario.corruptions)
 
     last_hash: Optional[str] = None
     hash_breaks = 0
@@ -229,7 +251,7 @@ def simulate(scenario: Scenario) -> SimulationResult:
         last_hash = node.eare_hash
 
         # apply corruptions for this node
-        for corr in corruptions_by_target.get(node.node_id, []) + corruptions_by_target.get("*", []):
+        for corr in targeted.get(node.node_id, ()) + wildcard:
             ctype = corr.type.upper()
             if ctype == "INVALID_SIGNATURE":
                 add_error("INVALID_SIGNATURE")
@@ -310,6 +332,7 @@ __all__ = [
     "GroupContext",
     "Node",
     "Corruption",
+    "iter_corpus",
     "load_corpus",
     "parse_scenario",
     "simulate",
@@ -1,16 +1,28 @@
 """Deterministic multi-device desynchronization simulator (Python oracle)."""
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from itertools import pairwise
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+try:  # optional fast JSON parser; stdlib json is the reference fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
 
 
 class CorpusError(ValueError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Device:
     device_id: str
     dr_version: int
@@ -19,7 +31,7 @@ class Device:
     notes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageEnvelope:
     msg_id: str
     sender: str
@@ -32,14 +44,41 @@ class MessageEnvelope:
     replay_count: int = 0
 
 
-@dataclass
+# Integer ids for timeline event kinds; simulate branches on these instead of strings.
+(
+    _KIND_SEND,
+    _KIND_RECV,
+    _KIND_DROP,
+    _KIND_REPLAY,
+    _KIND_BACKUP_RESTORE,
+    _KIND_CLOCK_SKEW,
+    _KIND_RESYNC,
+) = range(7)
+_KIND_UNKNOWN = -1
+
+_EVENT_KIND_IDS: Dict[str, int] = {
+    "send": _KIND_SEND,
+    "recv": _KIND_RECV,
+    "drop": _KIND_DROP,
+    "replay": _KIND_REPLAY,
+    "backup_restore": _KIND_BACKUP_RESTORE,
+    "clock_skew": _KIND_CLOCK_SKEW,
+    "resync": _KIND_RESYNC,
+}
+
+
+@dataclass(slots=True)
 class Event:
     t: int
     event: str
-    raw: Dict[str, Any]
+    raw: Mapping[str, Any]
+    kind_id: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.kind_id = _EVENT_KIND_IDS.get(self.event, _KIND_UNKNOWN)
 
 
-@dataclass
+@dataclass(slots=True)
 class Expectations:
     detected: bool
     max_detection_ms: int
@@ -54,16 +93,25 @@ class Expectations:
     max_rollback_events: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     scenario_id: str
     tags: List[str]
     devices: Dict[str, Device]
+    # Ordered by (t, event): parse_scenario sorts, __post_init__ sorts hand-built lists, simulate relies on it.
     events: List[Event]
     expectations: Expectations
+    # Column template of the initial device state, built once by parse_scenario
+    device_table: Optional[_DeviceTable] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Checked once here rather than on every simulate() call. Hand-built scenarios get a
+        # stably sorted copy, as simulate() used to produce, and the caller's list is left alone.
+        if not _events_ordered(self.events):
+            self.events = sorted(self.events, key=lambda e: (e.t, e.event))
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     detection: bool
     detection_ms: Optional[int]
@@ -89,6 +137,25 @@ class SimulationResult:
     metrics: Dict[str, Any]
 
 
+# Bit per error code simulate can raise; the error set is tracked as an int mask.
+_ERROR_BITS: Dict[str, int] = {
+    code: 1 << bit
+    for bit, code in enumerate(
+        (
+            "UNKNOWN_MESSAGE",
+            "DUPLICATE_DELIVERY",
+            "REPLAY_INJECTED",
+            "ROLLBACK_APPLIED",
+            "CLOCK_SKEW_VIOLATION",
+            "DIVERGENCE_DETECTED",
+            "MESSAGE_LOSS",
+            "OUT_OF_ORDER",
+        )
+    )
+}
+_DIVERGENCE_BIT = _ERROR_BITS["DIVERGENCE_DETECTED"]
+
+
 def _schema_error(scenario_id: str, detail: str) -> CorpusError:
     return CorpusError(f"[{scenario_id}] {detail}")
 
@@ -114,26 +181,81 @@ def _validate_devices(data: Any, scenario_id: str) -> Dict[str, Device]:
             raise _schema_error(scenario_id, f"device {device_id} clock_ms must be integer")
         if state_hash is not None and not isinstance(state_hash, str):
             raise _schema_error(scenario_id, f"device {device_id} state_hash must be string or null")
+        if type(state_hash) is str:
+            state_hash = sys.intern(state_hash)
         devices[device_id] = Device(device_id=device_id, dr_version=dr_version, clock_ms=clock_ms, state_hash=state_hash)
     return devices
 
 
+# Timeline keys read by ``simulate``; anything else in a timeline entry is ignored.
+_EVENT_FIELDS = frozenset(
+    {
+        "event",
+        "t",
+        "msg_id",
+        "from",
+        "to",
+        "device",
+        "dr_version",
+        "state_hash",
+        "apply_dr_version",
+        "delta_ms",
+        "target_dr_version",
+        "targets",
+    }
+)
+
+
+# Device-id lists in timeline entries (send/replay "to", drop "targets").
+_TARGET_FIELDS = ("to", "targets")
+
+
 def _validate_events(data: Any, scenario_id: str) -> List[Event]:
     if not isinstance(data, list) or not data:
         raise _schema_error(scenario_id, "timeline must be a non-empty array")
     events: List[Event] = []
+    append = events.append
+    # Authored timelines are usually already in (t, event) order; detect that
+    # during validation so the sort below can be skipped.
+    in_order = True
+    last_t: Optional[int] = None
+    last_kind = ""
     for idx, raw in enumerate(data):
         if not isinstance(raw, dict):
             raise _schema_error(scenario_id, "timeline entry must be an object")
-        if "event" not in raw or not isinstance(raw["event"], str):
+        # single .get per key: a missing key yields None, which fails the type check
+        kind = raw.get("event")
+        if not isinstance(kind, str):
             raise _schema_error(scenario_id, f"timeline[{idx}] missing event string")
-        if "t" not in raw or not isinstance(raw["t"], int):
+        t = raw.get("t")
+        if not isinstance(t, int):
             raise _schema_error(scenario_id, f"timeline[{idx}] missing integer t")
-        events.append(Event(t=int(raw["t"]), event=str(raw["event"]), raw=raw))
-    events.sort(key=lambda e: (e.t, e.event))
+        t = int(t)
+        if in_order and last_t is not None and (t < last_t or (t == last_t and kind < last_kind)):
+            in_order = False
+        last_t, last_kind = t, kind
+        known = {key: value for key, value in raw.items() if key in _EVENT_FIELDS}
+        state_hash = known.get("state_hash")
+        if type(state_hash) is str:
+            # interned so equal hashes share one object and compare by identity
+            known["state_hash"] = sys.intern(state_hash)
+        for key in _TARGET_FIELDS:
+            targets = known.get(key)
+            if isinstance(targets, list):
+                # normalized once here; simulate uses these lists as-is
+                known[key] = [str(target) for target in targets]
+        append(Event(t=t, event=kind, raw=known))
+    # This is the only place the timeline is ordered; simulate() replays events
+    # as-is. list.sort is stable, so same-(t, event) entries keep corpus order.
+    if not in_order:
+        events.sort(key=lambda e: (e.t, e.event))
     return events
 
 
+def _events_ordered(events: List[Event]) -> bool:
+    return all((a.t, a.event) <= (b.t, b.event) for a, b in pairwise(events))
+
+
 def _validate_expectations(data: Any, scenario_id: str) -> Expectations:
     if not isinstance(data, dict):
         raise _schema_error(scenario_id, "expectations must be an object")
@@ -194,37 +316,197 @@ def parse_scenario(raw: Dict[str, Any]) -> Scenario:
     devices = _validate_devices(raw.get("devices"), scenario_id)
     events = _validate_events(raw.get("timeline"), scenario_id)
     expectations = _validate_expectations(raw.get("expectations", {}), scenario_id)
-    return Scenario(scenario_id=scenario_id, tags=tags, devices=devices, events=events, expectations=expectations)
+    try:
+        device_table = _DeviceTable(devices)
+    except OverflowError:
+        raise _schema_error(scenario_id, "device dr_version/clock_ms must fit in 64 bits") from None
+    return Scenario(
+        scenario_id=scenario_id,
+        tags=tags,
+        devices=devices,
+        events=events,
+        expectations=expectations,
+        device_table=device_table,
+    )
 
 
-def load_corpus(path: str) -> List[Scenario]:
-    with open(path, "r", encoding="utf-8") as handle:
-        data = json.load(handle)
+def _parse_corpus(raw_bytes: bytes) -> List[Scenario]:
+    data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
     if not isinstance(data, list):
         raise CorpusError("Corpus root must be a list of scenarios")
     return [parse_scenario(entry) for entry in data]
 
 
-def _current_dr_stats(devices: Dict[str, Device]) -> Tuple[int, int, int]:
-    versions = [device.dr_version for device in devices.values()]
-    min_ver = min(versions)
-    max_ver = max(versions)
-    return min_ver, max_ver, max_ver - min_ver
+def load_corpus(path: str) -> List[Scenario]:
+    with open(path, "rb") as handle:
+        raw_bytes = handle.read()
+    return _parse_corpus(raw_bytes)
+
+
+# Bump when Scenario/Event/_DeviceTable layout changes so stale caches are ignored.
+_CORPUS_CACHE_VERSION = 4
+
+
+def _private_cache_dir() -> Optional[str]:
+    """Per-user cache directory, or None if it is not private to this user.
+
+    Pickles run code when loaded, so the cache is only used from a directory
+    that this user owns and nobody else can write to.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = os.path.join(base, "foxwhisper", "desync")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        st = os.stat(cache_dir)
+    except OSError:
+        return None
+    getuid = getattr(os, "getuid", None)
+    if getuid is not None and (st.st_uid != getuid() or st.st_mode & 0o022):
+        return None
+    return cache_dir
+
+
+def load_corpus_cached(path: str) -> List[Scenario]:
+    """Like ``load_corpus`` but reuses a pickled, already-validated corpus.
+
+    The cache lives in a private per-user directory (``$XDG_CACHE_HOME`` or
+    ``~/.cache``, under ``foxwhisper/desync``) and is keyed by the corpus path
+    and a BLAKE2b digest of its bytes, so any edit to the file invalidates it;
+    superseded entries for the same corpus are removed when a new one is
+    written. Cache read/write problems fall back to a normal parse. Callers
+    opt in; ``load_corpus`` never touches the cache.
+    """
+    with open(path, "rb") as handle:
+        raw_bytes = handle.read()
+    cache_dir = _private_cache_dir()
+    if cache_dir is None:
+        return _parse_corpus(raw_bytes)
+    corpus_key = hashlib.blake2b(os.path.abspath(path).encode("utf-8"), digest_size=8).hexdigest()
+    digest = hashlib.blake2b(raw_bytes, digest_size=16).hexdigest()
+    cache_name = f"{corpus_key}.desync-v{_CORPUS_CACHE_VERSION}.{digest}.pickle"
+    cache_path = os.path.join(cache_dir, cache_name)
+    try:
+        with open(cache_path, "rb") as handle:
+            return pickle.load(handle)
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+        pass
+
+    scenarios = _parse_corpus(raw_bytes)
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as handle:
+            pickle.dump(scenarios, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        stale_prefix = f"{corpus_key}.desync-v"
+        for name in os.listdir(cache_dir):
+            if name.startswith(stale_prefix) and name.endswith(".pickle") and name != cache_name:
+                os.remove(os.path.join(cache_dir, name))
+    except OSError:
+        pass
+    return scenarios
+
+
+class _RunningRange:
+    """Multiset of ints tracking min/max under single-value replacements.
+
+    The extrema are only rescanned (over distinct values) when the replaced
+    value was the last copy of the current min or max, so per-event updates are
+    O(1) amortized instead of an O(devices) rebuild.
+    """
+
+    __slots__ = ("counts", "low", "high")
+
+    def __init__(self, values: Iterable[int]) -> None:
+        self.counts: Dict[int, int] = {}
+        for value in values:
+            self.counts[value] = self.counts.get(value, 0) + 1
+        self.low = min(self.counts)
+        self.high = max(self.counts)
+
+    def replace(self, old: int, new: int) -> None:
+        if old == new:
+            return
+        counts = self.counts
+        remaining = counts[old] - 1
+        if remaining:
+            counts[old] = remaining
+        else:
+            del counts[old]
+        counts[new] = counts.get(new, 0) + 1
+        if new < self.low:
+            self.low = new
+        elif not remaining and old == self.low:
+            self.low = min(counts)
+        if new > self.high:
+            self.high = new
+        elif not remaining and old == self.high:
+            self.high = max(counts)
+
+
+def _state_hash_divergence(hashes: List[Optional[str]]) -> bool:
+    # Hashes are interned at parse time, so the != below is usually an identity check;
+    # stop at the first hash that differs instead of building a set of all of them.
+    first: Optional[str] = None
+    for state_hash in hashes:
+        if state_hash is None:
+            continue
+        if first is None:
+            first = state_hash
+        elif state_hash != first:
+            return True
+    return False
+
+
+def _max_clock_skew(clocks: List[int]) -> int:
+    return max(clocks) - min(clocks) if clocks else 0
+
+
+class _DeviceTable:
+    """Column-oriented (struct-of-arrays) device state mutated by ``simulate``.
 
+    Each field is indexed by the device's position in ``index``, which avoids
+    per-device attribute dispatch in the per-event bookkeeping. The integer
+    columns are contiguous ``array('q')`` buffers (int64, matching the Go and
+    Rust validators), so copying a template is a memcpy; assigning a value
+    outside int64 raises OverflowError.
+    """
 
-def _state_hash_divergence(devices: Dict[str, Device]) -> bool:
-    hashes = {device.state_hash for device in devices.values() if device.state_hash is not None}
-    return len(hashes) > 1
+    __slots__ = ("index", "dr_version", "clock_ms", "state_hash")
 
+    def __init__(self, devices: Dict[str, Device]) -> None:
+        self.index: Dict[str, int] = {device_id: idx for idx, device_id in enumerate(devices)}
+        self.dr_version = array("q", [device.dr_version for device in devices.values()])
+        self.clock_ms = array("q", [device.clock_ms for device in devices.values()])
+        self.state_hash: List[Optional[str]] = [device.state_hash for device in devices.values()]
 
-def _max_clock_skew(devices: Dict[str, Device]) -> int:
-    clocks = [device.clock_ms for device in devices.values()]
-    return max(clocks) - min(clocks) if clocks else 0
+    def copy(self) -> _DeviceTable:
+        clone = _DeviceTable.__new__(_DeviceTable)
+        clone.index = self.index  # never mutated, safe to share
+        clone.dr_version = self.dr_version[:]
+        clone.clock_ms = self.clock_ms[:]
+        clone.state_hash = self.state_hash[:]
+        return clone
 
 
 def simulate(scenario: Scenario) -> SimulationResult:
-    devices = {k: Device(**vars(v)) for k, v in scenario.devices.items()}
+    try:
+        return _simulate(scenario)
+    except OverflowError:
+        raise CorpusError(
+            f"[{scenario.scenario_id}] timeline dr_version/clock value does not fit in 64 bits"
+        ) from None
+
+
+def _simulate(scenario: Scenario) -> SimulationResult:
+    table = (scenario.device_table or _DeviceTable(scenario.devices)).copy()
+    slot = table.index
+    dr = table.dr_version
+    clocks = table.clock_ms
+    hashes = table.state_hash
     messages: Dict[str, MessageEnvelope] = {}
+    # dr_version extrema, kept in sync with every dr[...] assignment below
+    dr_range = _RunningRange(dr)
+    device_count = len(dr)
 
     detection_time: Optional[int] = None
     divergence_start: Optional[int] = None
@@ -238,160 +520,204 @@ def simulate(scenario: Scenario) -> SimulationResult:
     dr_samples = 0
     max_dr_delta = 0
     max_diverged_device_count = 0
-    max_clock_skew_ms = _max_clock_skew(devices)
+    max_clock_skew_ms = _max_clock_skew(clocks)
+    # Clock extrema; alignment only raises clocks, so these update in O(1) except
+    # when a clock_skew event moves the device that held an extremum inward.
+    clock_low = min(clocks)
+    clock_high = max(clocks)
     skew_violations = 0
     recovery_attempts = 0
     successful_recoveries = 0
     failed_recoveries = 0
     max_rollback_events = 0
     errors: List[str] = []
+    error_mask = 0  # _ERROR_BITS of codes already in errors, which keeps first-seen order
     notes: List[str] = []
 
     def mark_error(code: str, at: Optional[int] = None) -> None:
-        nonlocal detection_time
-        if code not in errors:
+        nonlocal detection_time, error_mask
+        bit = _ERROR_BITS[code]
+        if not error_mask & bit:
+            error_mask |= bit
             errors.append(code)
         if detection_time is None and at is not None:
             detection_time = at
 
-    for event in sorted(scenario.events, key=lambda ev: (ev.t, ev.event)):
-        kind = event.event
-        payload = event.raw
+    # Loop invariants hoisted out of the per-event body
+    scenario_id = scenario.scenario_id
+    skew_limit_ms = scenario.expectations.max_clock_skew_ms
 
-        # Keep clocks roughly aligned to timeline time
-        for dev in devices.values():
-            dev.clock_ms = max(dev.clock_ms, event.t)
+    dr_dirty = True  # set whenever an event assigns a dr_version
+    dr_delta = 0
+    for event in scenario.events:
+        now = event.t
+        kind = event.kind_id
+        payload = event.raw
 
-        if kind == "send":
+        # Keep clocks roughly aligned to timeline time; nothing to do once every
+        # clock (i.e. the minimum) has already reached it.
+        if clock_low < now:
+            for idx, clock in enumerate(clocks):
+                if clock < now:
+                    clocks[idx] = now
+            clock_low = now
+            if clock_high < now:
+                clock_high = now
+
+        if kind == _KIND_SEND:
             msg_id = payload.get("msg_id")
             sender = payload.get("from")
             targets = payload.get("to", [])
             dr_version = payload.get("dr_version")
             state_hash = payload.get("state_hash")
             if not isinstance(msg_id, str) or not isinstance(sender, str) or not isinstance(targets, list):
-                raise CorpusError(f"[{scenario.scenario_id}] invalid send event")
-            if sender not in devices:
-                raise CorpusError(f"[{scenario.scenario_id}] send references unknown device {sender}")
+                raise CorpusError(f"[{scenario_id}] invalid send event")
+            if sender not in slot:
+                raise CorpusError(f"[{scenario_id}] send references unknown device {sender}")
+            sender_idx = slot[sender]
             if msg_id not in messages:
                 messages[msg_id] = MessageEnvelope(
                     msg_id=msg_id,
                     sender=sender,
-                    targets=[str(t) for t in targets],
-                    dr_version=int(dr_version) if dr_version is not None else devices[sender].dr_version,
+                    targets=targets,
+                    dr_version=int(dr_version) if dr_version is not None else dr[sender_idx],
                     state_hash=state_hash if isinstance(state_hash, str) else None,
-                    send_time=event.t,
+                    send_time=now,
                 )
             else:
                 messages[msg_id].replay_count += 1
             expected_messages += len(targets)
-            sender_state = devices.get(sender)
-            if sender_state:
-                new_ver = int(dr_version) if dr_version is not None else sender_state.dr_version
-                if new_ver < sender_state.dr_version:
-                    max_rollback_events = max(max_rollback_events, sender_state.dr_version - new_ver)
-                sender_state.dr_version = new_ver
-                if isinstance(state_hash, str):
-                    sender_state.state_hash = state_hash
-
-        elif kind == "recv":
+            current_ver = dr[sender_idx]
+            new_ver = int(dr_version) if dr_version is not None else current_ver
+            if new_ver < current_ver:
+                max_rollback_events = max(max_rollback_events, current_ver - new_ver)
+            dr_range.replace(current_ver, new_ver)
+            dr_dirty = True
+            dr[sender_idx] = new_ver
+            if isinstance(state_hash, str):
+                hashes[sender_idx] = state_hash
+
+        elif kind == _KIND_RECV:
             msg_id = payload.get("msg_id")
             device_id = payload.get("device")
-            if msg_id not in messages or device_id not in devices:
-                mark_error("UNKNOWN_MESSAGE", event.t)
-            if msg_id in messages and device_id in devices:
+            if msg_id not in messages or device_id not in slot:
+                mark_error("UNKNOWN_MESSAGE", now)
+            if msg_id in messages and device_id in slot:
                 envelope = messages[msg_id]
                 if device_id in envelope.delivered:
                     mark_error("DUPLICATE_DELIVERY")
-                if event.t < envelope.send_time:
+                if now < envelope.send_time:
                     out_of_order += 1
                 envelope.delivered.add(device_id)
                 delivered_messages += 1
                 apply_ver = payload.get("apply_dr_version")
                 apply_hash = payload.get("state_hash")
-                dev = devices[device_id]
+                idx = slot[device_id]
                 if apply_ver is not None:
                     apply_ver = int(apply_ver)
-                    if apply_ver < dev.dr_version:
-                        max_rollback_events = max(max_rollback_events, dev.dr_version - apply_ver)
-                    dev.dr_version = apply_ver
+                    current_ver = dr[idx]
+                    if apply_ver < current_ver:
+                        max_rollback_events = max(max_rollback_events, current_ver - apply_ver)
+                    dr_range.replace(current_ver, apply_ver)
+                    dr_dirty = True
+                    dr[idx] = apply_ver
                 if isinstance(apply_hash, str):
-                    dev.state_hash = apply_hash
+                    hashes[idx] = apply_hash
 
-        elif kind == "drop":
+        elif kind == _KIND_DROP:
             msg_id = payload.get("msg_id")
             targets = payload.get("targets")
             if msg_id not in messages:
-                mark_error("UNKNOWN_MESSAGE", event.t)
+                mark_error("UNKNOWN_MESSAGE", now)
             else:
                 envelope = messages[msg_id]
-                target_list = [str(t) for t in targets] if isinstance(targets, list) else envelope.targets
+                target_list = targets if isinstance(targets, list) else envelope.targets
                 envelope.dropped.update(target_list)
                 dropped_messages += len(target_list)
 
-        elif kind == "replay":
+        elif kind == _KIND_REPLAY:
             msg_id = payload.get("msg_id")
             sender = payload.get("from")
-            targets = [str(t) for t in payload.get("to", [])]
+            targets = payload.get("to", [])
+            if not isinstance(targets, list):
+                targets = [str(t) for t in targets]
             dr_version = payload.get("dr_version")
             if not isinstance(msg_id, str) or not isinstance(sender, str):
-                raise CorpusError(f"[{scenario.scenario_id}] invalid replay event")
-            if sender not in devices:
-                raise CorpusError(f"[{scenario.scenario_id}] replay references unknown device {sender}")
+                raise CorpusError(f"[{scenario_id}] invalid replay event")
+            if sender not in slot:
+                raise CorpusError(f"[{scenario_id}] replay references unknown device {sender}")
             if msg_id not in messages:
                 messages[msg_id] = MessageEnvelope(
                     msg_id=msg_id,
                     sender=sender,
                     targets=targets,
-                    dr_version=int(dr_version) if dr_version is not None else devices[sender].dr_version,
+                    dr_version=int(dr_version) if dr_version is not None else dr[slot[sender]],
                     state_hash=None,
-                    send_time=event.t,
+                    send_time=now,
                     replay_count=1,
                 )
             else:
                 messages[msg_id].replay_count += 1
             expected_messages += len(targets)
-            mark_error("REPLAY_INJECTED", event.t)
+            mark_error("REPLAY_INJECTED", now)
 
-        elif kind == "backup_restore":
+        elif kind == _KIND_BACKUP_RESTORE:
             device_id = payload.get("device")
             new_version = payload.get("dr_version")
             state_hash = payload.get("state_hash")
-            if device_id not in devices or not isinstance(new_version, int):
-                raise CorpusError(f"[{scenario.scenario_id}] invalid backup_restore event")
-            dev = devices[device_id]
-            if new_version < dev.dr_version:
-                max_rollback_events = max(max_rollback_events, dev.dr_version - new_version)
+            if device_id not in slot or not isinstance(new_version, int):
+                raise CorpusError(f"[{scenario_id}] invalid backup_restore event")
+            idx = slot[device_id]
+            current_ver = dr[idx]
+            if new_version < current_ver:
+                max_rollback_events = max(max_rollback_events, current_ver - new_version)
                 mark_error("ROLLBACK_APPLIED")
-            dev.dr_version = new_version
+            dr_range.replace(current_ver, new_version)
+            dr_dirty = True
+            dr[idx] = new_version
             if isinstance(state_hash, str):
-                dev.state_hash = state_hash
+                hashes[idx] = state_hash
 
-        elif kind == "clock_skew":
+        elif kind == _KIND_CLOCK_SKEW:
             device_id = payload.get("device")
             delta = payload.get("delta_ms")
-            if device_id not in devices or not isinstance(delta, int):
-                raise CorpusError(f"[{scenario.scenario_id}] invalid clock_skew event")
-            devices[device_id].clock_ms += delta
-            max_clock_skew_ms = max(max_clock_skew_ms, _max_clock_skew(devices))
-            if max_clock_skew_ms > scenario.expectations.max_clock_skew_ms:
+            if device_id not in slot or not isinstance(delta, int):
+                raise CorpusError(f"[{scenario_id}] invalid clock_skew event")
+            idx = slot[device_id]
+            old_clock = clocks[idx]
+            new_clock = old_clock + delta
+            clocks[idx] = new_clock
+            if new_clock > clock_high:
+                clock_high = new_clock
+            elif old_clock == clock_high and new_clock < old_clock:
+                clock_high = max(clocks)
+            if new_clock < clock_low:
+                clock_low = new_clock
+            elif old_clock == clock_low and new_clock > old_clock:
+                clock_low = min(clocks)
+            max_clock_skew_ms = max(max_clock_skew_ms, clock_high - clock_low)
+            if max_clock_skew_ms > skew_limit_ms:
                 skew_violations += 1
-                mark_error("CLOCK_SKEW_VIOLATION", event.t)
+                mark_error("CLOCK_SKEW_VIOLATION", now)
 
-        elif kind == "resync":
+        elif kind == _KIND_RESYNC:
             device_id = payload.get("device")
             target_version = payload.get("target_dr_version")
             state_hash = payload.get("state_hash")
-            if device_id not in devices or not isinstance(target_version, int):
-                raise CorpusError(f"[{scenario.scenario_id}] invalid resync event")
-            dev = devices[device_id]
+            if device_id not in slot or not isinstance(target_version, int):
+                raise CorpusError(f"[{scenario_id}] invalid resync event")
+            idx = slot[device_id]
+            current_ver = dr[idx]
             recovery_attempts += 1
-            before_delta = _current_dr_stats(devices)[2]
-            if target_version < dev.dr_version:
-                max_rollback_events = max(max_rollback_events, dev.dr_version - target_version)
-            dev.dr_version = target_version
+            before_delta = dr_range.high - dr_range.low
+            if target_version < current_ver:
+                max_rollback_events = max(max_rollback_events, current_ver - target_version)
+            dr_range.replace(current_ver, target_version)
+            dr_dirty = True
+            dr[idx] = target_version
             if isinstance(state_hash, str):
-                dev.state_hash = state_hash
-            after_delta = _current_dr_stats(devices)[2]
+                hashes[idx] = state_hash
+            after_delta = dr_range.high - dr_range.low
             if after_delta == 0:
                 successful_recoveries += 1
             elif after_delta < before_delta:
@@ -400,29 +726,34 @@ def simulate(scenario: Scenario) -> SimulationResult:
                 failed_recoveries += 1
 
         else:
-            raise CorpusError(f"[{scenario.scenario_id}] unsupported event type {kind}")
-
-        # Update divergence metrics after applying the event
-        min_ver, max_ver, dr_delta = _current_dr_stats(devices)
+            raise CorpusError(f"[{scenario_id}] unsupported event type {event.event}")
+
+        # Update divergence metrics after applying the event; dr_delta and
+        # diverged_count carry over unchanged from events that touched no dr_version.
+        if dr_dirty:
+            dr_dirty = False
+            min_ver = dr_range.low
+            dr_delta = dr_range.high - min_ver
+            max_dr_delta = max(max_dr_delta, dr_delta)
+            # devices off the minimum version = all devices minus those sitting on it
+            diverged_count = device_count - dr_range.counts[min_ver]
+            max_diverged_device_count = max(max_diverged_device_count, diverged_count)
         dr_delta_integral += dr_delta
         dr_samples += 1
-        max_dr_delta = max(max_dr_delta, dr_delta)
 
         divergence_active = dr_delta > 0
         if divergence_active and divergence_start is None:
-            divergence_start = event.t
-            detection_time = detection_time or event.t
+            divergence_start = now
+            detection_time = detection_time or now
         if divergence_active:
-            if "DIVERGENCE_DETECTED" not in errors:
+            if not error_mask & _DIVERGENCE_BIT:
+                error_mask |= _DIVERGENCE_BIT
                 errors.append("DIVERGENCE_DETECTED")
         if divergence_active is False and divergence_start is not None and recovery_time is None:
-            recovery_time = event.t
+            recovery_time = now
 
-        divergent_devices = {dev_id for dev_id, dev in devices.items() if dev.dr_version != min_ver}
-        max_diverged_device_count = max(max_diverged_device_count, len(divergent_devices))
-
-        # Track clock skew for each step
-        max_clock_skew_ms = max(max_clock_skew_ms, _max_clock_skew(devices))
+        # No per-step clock skew update: alignment only raises lagging clocks, which
+        # can never widen the skew, and the clock_skew branch records its own peak.
 
     if divergence_start is None and errors:
         if scenario.events:
@@ -432,7 +763,7 @@ def simulate(scenario: Scenario) -> SimulationResult:
             divergence_start = 0
             detection_time = detection_time or 0
 
-    residual_divergence = _current_dr_stats(devices)[2] > 0
+    residual_divergence = dr_range.high > dr_range.low
     detection = divergence_start is not None or bool(errors)
     detection_ms = None
     if detection_time is not None and divergence_start is not None:
@@ -455,13 +786,13 @@ def simulate(scenario: Scenario) -> SimulationResult:
     if out_of_order > 0:
         mark_error("OUT_OF_ORDER")
 
-    min_ver_for_metrics, _, _ = _current_dr_stats(devices)
+    min_ver_for_metrics = dr_range.low
 
     metrics = {
         "max_dr_version_delta": max_dr_delta,
         "avg_dr_version_delta": avg_dr_delta,
         "max_clock_skew_ms": max_clock_skew_ms,
-        "diverged_device_count": len({dev.device_id for dev in devices.values() if dev.dr_version != min_ver_for_metrics}),
+        "diverged_device_count": device_count - dr_range.counts[min_ver_for_metrics],
         "max_diverged_device_count": max_diverged_device_count,
         "delivered_messages": delivered_messages,
         "expected_messages": expected_messages,
@@ -502,6 +833,31 @@ def simulate(scenario: Scenario) -> SimulationResult:
     )
 
 
+def _simulate_isolated(scenario: Scenario) -> Union[SimulationResult, CorpusError]:
+    try:
+        return simulate(scenario)
+    except CorpusError as exc:
+        return exc
+
+
+def simulate_corpus(
+    scenarios: Sequence[Scenario], max_workers: Optional[int] = None
+) -> Iterator[Union[SimulationResult, CorpusError]]:
+    """Simulate independent scenarios, fanning out across worker processes.
+
+    Results are yielded in input order. A scenario rejected by ``simulate``
+    yields its ``CorpusError`` in place of a result so one bad timeline does
+    not abort the batch. ``max_workers`` of 1 (or less) runs serially in this
+    process; ``None`` uses one worker per CPU.
+    """
+    if max_workers is not None and max_workers <= 1:
+        for scenario in scenarios:
+            yield _simulate_isolated(scenario)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        yield from pool.map(_simulate_isolated, scenarios)
+
+
 def evaluate_expectations(scenario: Scenario, result: SimulationResult) -> Tuple[str, List[str]]:
     exp = scenario.expectations
     failures: List[str] = []
@@ -556,8 +912,10 @@ __all__ = [
     "Device",
     "MessageEnvelope",
     "load_corpus",
+    "load_corpus_cached",
     "parse_scenario",
     "simulate",
+    "simulate_corpus",
     "evaluate_expectations",
     "CorpusError",
 ]
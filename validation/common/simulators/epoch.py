@@ -1,12 +1,25 @@
 """Deterministic epoch-fork simulator and corpus parser."""
 from __future__ import annotations
 
+import hashlib
 import json
+import sys
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from heapq import nlargest
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
+try:  # optional fast JSON parser; stdlib json is the reference fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+
+@dataclass(slots=True)
 class EpochNode:
     node_id: str
     epoch_id: int
@@ -18,15 +31,15 @@ class EpochNode:
     timestamp_ms: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EpochEdge:
     source: str
     target: str
     edge_type: str
 
 
-@dataclass
-class Event:
+class Event(NamedTuple):
+    # A plain tuple: scenarios can carry many events and they are never mutated
     t: int
     event: str
     controller: Optional[str] = None
@@ -35,16 +48,16 @@ class Event:
     participants: Optional[List[str]] = None
     reconcile_strategy: Optional[str] = None
     count: Optional[int] = None
-    faults: List[str] = field(default_factory=list)
+    faults: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class AllowReplayGap:
     max_messages: int
     max_ms: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Expectations:
     detected: bool
     detection_reference: str
@@ -57,7 +70,7 @@ class Expectations:
     max_wall_time_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     scenario_id: str
     group_context: Dict[str, Any]
@@ -66,9 +79,11 @@ class Scenario:
     events: List[Event]
     expectations: Expectations
     tags: List[str]
+    # Columnar copy of the hot node fields (with depths), precomputed by parse_scenario
+    node_table: Optional[_NodeTable] = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     detection: bool
     detection_ms: Optional[int]
@@ -81,24 +96,79 @@ class SimulationResult:
     errors: List[str]
     false_positives: Dict[str, int]
     notes: List[str]
+    # Set view of errors for membership checks; errors keeps the reporting order
+    errors_set: Set[str] = field(default_factory=set, repr=False, compare=False)
 
 
 class CorpusError(ValueError):
     pass
 
 
-def _parse_faults(raw: Optional[List[str]]) -> List[str]:
+def _parse_faults(raw: Optional[List[str]]) -> Tuple[str, ...]:
     if not raw:
-        return []
-    return [str(item) for item in raw]
+        return ()
+    return tuple(str(item) for item in raw)
+
+
+def _intern_id(value: Any) -> Any:
+    """Intern string identifiers; other JSON values pass through for validation."""
+    return sys.intern(value) if type(value) is str else value
+
+
+_CORPUS_CACHE_SIZE = 32
+# Parsed corpora keyed on a digest of the file bytes, oldest first
+_corpus_cache: Dict[bytes, Tuple[Scenario, ...]] = {}
 
 
 def load_corpus(path: str) -> List[Scenario]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    """Parse the corpus at ``path``, reusing an earlier parse of identical bytes.
+
+    The file is always read, and parses are memoized per process on a digest of
+    its contents, so an edit is picked up even when mtime and size are unchanged.
+    The returned list is fresh, but the ``Scenario`` objects in it are shared
+    between calls and must be treated as read-only (``simulate`` never mutates them).
+    """
+    with open(path, "rb") as f:
+        raw_bytes = f.read()
+    digest = hashlib.sha256(raw_bytes).digest()
+    scenarios = _corpus_cache.get(digest)
+    if scenarios is None:
+        scenarios = _parse_corpus(raw_bytes)
+        if len(_corpus_cache) >= _CORPUS_CACHE_SIZE:
+            del _corpus_cache[next(iter(_corpus_cache))]
+        _corpus_cache[digest] = scenarios
+    return list(scenarios)
+
+
+def _parse_corpus(raw_bytes: bytes) -> Tuple[Scenario, ...]:
+    data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
     if not isinstance(data, list):
         raise CorpusError("Corpus root must be a list of scenarios")
-    return [parse_scenario(obj) for obj in data]
+    return tuple(parse_scenario(obj) for obj in data)
+
+
+def _build_events(raw_events: List[Dict[str, Any]]) -> List[Event]:
+    events: List[Event] = []
+    append = events.append
+    for ev in raw_events:
+        get = ev.get
+        t = int(get("t", 0))
+        event = str(get("event"))
+        # Positional, in field order: avoids building a kwargs dict per event
+        append(
+            Event(
+                t,
+                event,
+                get("controller"),
+                get("epoch_id"),
+                _intern_id(get("node_id")),
+                get("participants"),
+                get("reconcile_strategy"),
+                get("count"),
+                _parse_faults(get("faults")),
+            )
+        )
+    return events
 
 
 def parse_scenario(data: Dict[str, Any]) -> Scenario:
@@ -108,59 +178,57 @@ def parse_scenario(data: Dict[str, Any]) -> Scenario:
 
     tags = [str(t) for t in data.get("tags", [])]
 
-    raw_nodes = data.get("graph", {}).get("nodes", [])
+    graph = data.get("graph", {})
+    raw_nodes = graph.get("nodes", [])
     nodes: Dict[str, EpochNode] = {}
+    # (child, parent) pairs to resolve once every node is known; JSON order isn't parent-first
+    parent_refs: List[Tuple[str, str]] = []
     for node_data in raw_nodes:
-        node_id = str(node_data["node_id"])
+        # Ids and hashes are interned: they are the dict keys and set members simulate() hits per event
+        node_id = sys.intern(str(node_data["node_id"]))
         if node_id in nodes:
             raise CorpusError(f"Duplicate node_id {node_id} in scenario {scenario_id}")
+        get = node_data.get
+        epoch_id = int(node_data["epoch_id"])
+        eare_hash = sys.intern(str(node_data["eare_hash"]))
+        parent_id = _intern_id(get("parent_id"))
         nodes[node_id] = EpochNode(
-            node_id=node_id,
-            epoch_id=int(node_data["epoch_id"]),
-            eare_hash=str(node_data["eare_hash"]),
-            previous_epoch_hash=node_data.get("previous_epoch_hash"),
-            membership_digest=node_data.get("membership_digest"),
-            parent_id=node_data.get("parent_id"),
-            issued_by=str(node_data.get("issued_by", "")),
-            timestamp_ms=int(node_data.get("timestamp_ms", 0)),
+            node_id,
+            epoch_id,
+            eare_hash,
+            get("previous_epoch_hash"),
+            get("membership_digest"),
+            parent_id,
+            str(get("issued_by", "")),
+            int(get("timestamp_ms", 0)),
         )
+        if parent_id:
+            parent_refs.append((node_id, parent_id))
 
-    raw_edges = data.get("graph", {}).get("edges", [])
+    raw_edges = graph.get("edges", [])
     edges: List[EpochEdge] = []
     for edge in raw_edges:
         src = edge.get("from")
         tgt = edge.get("to")
         if src not in nodes or tgt not in nodes:
             raise CorpusError(f"Edge references unknown node in scenario {scenario_id}")
-        edges.append(EpochEdge(source=str(src), target=str(tgt), edge_type=str(edge.get("type", "linear"))))
-
-    raw_events = data.get("event_stream", [])
-    events: List[Event] = []
-    for ev in raw_events:
-        events.append(
-            Event(
-                t=int(ev.get("t", 0)),
-                event=str(ev.get("event")),
-                controller=ev.get("controller"),
-                epoch_id=ev.get("epoch_id"),
-                node_id=ev.get("node_id"),
-                participants=ev.get("participants"),
-                reconcile_strategy=ev.get("reconcile_strategy"),
-                count=ev.get("count"),
-                faults=_parse_faults(ev.get("faults")),
-            )
+        edges.append(
+            EpochEdge(source=sys.intern(str(src)), target=sys.intern(str(tgt)), edge_type=str(edge.get("type", "linear")))
         )
 
+    events = _build_events(data.get("event_stream", []))
+
     exp_raw = data.get("expectations", {})
     allow = exp_raw.get("allow_replay_gap", {})
+    reconciled = exp_raw.get("reconciled_epoch", {})
     expectations = Expectations(
         detected=bool(exp_raw.get("detected", False)),
         detection_reference=str(exp_raw.get("detection_reference", "fork_created")),
         max_detection_ms=int(exp_raw.get("max_detection_ms", 0)),
         max_reconciliation_ms=int(exp_raw.get("max_reconciliation_ms", 0)),
         reconciled_epoch=(
-            int(exp_raw.get("reconciled_epoch", {}).get("epoch_id", 0)),
-            str(exp_raw.get("reconciled_epoch", {}).get("eare_hash", "")),
+            int(reconciled.get("epoch_id", 0)),
+            str(reconciled.get("eare_hash", "")),
         ),
         allow_replay_gap=AllowReplayGap(
             max_messages=int(allow.get("max_messages", 0)),
@@ -172,9 +240,14 @@ def parse_scenario(data: Dict[str, Any]) -> Scenario:
     )
 
     # Validate parent references
-    for node in nodes.values():
-        if node.parent_id and node.parent_id not in nodes:
-            raise CorpusError(f"Node {node.node_id} references unknown parent {node.parent_id}")
+    for child_id, parent_id in parent_refs:
+        if parent_id not in nodes:
+            raise CorpusError(f"Node {child_id} references unknown parent {parent_id}")
+
+    try:
+        node_table = _NodeTable(nodes)
+    except OverflowError:
+        raise CorpusError(f"Node epoch_id/timestamp_ms must fit in 64 bits in scenario {scenario_id}") from None
 
     return Scenario(
         scenario_id=scenario_id,
@@ -184,23 +257,109 @@ def parse_scenario(data: Dict[str, Any]) -> Scenario:
         events=events,
         expectations=expectations,
         tags=tags,
+        node_table=node_table,
     )
 
 
-def _depth(node_id: str, nodes: Dict[str, EpochNode]) -> int:
+class _NodeTable:
+    """Column-oriented (struct-of-arrays) view of the fields the winner selection reads.
+
+    Columns are indexed by the node's position in ``index``. ``parent_idx`` is -1
+    for roots and -2 for a parent id that is not in the scenario (only possible
+    for hand-built scenarios; parse_scenario rejects them). The integer columns
+    are ``array('q')`` (int64, like the Go and Rust validators), so values
+    outside int64 raise OverflowError.
+    """
+
+    __slots__ = ("index", "epoch_ids", "timestamps_ms", "parent_idx", "depths")
+
+    def __init__(self, nodes: Dict[str, EpochNode]) -> None:
+        self.index: Dict[str, int] = {node_id: idx for idx, node_id in enumerate(nodes)}
+        self.epoch_ids = array("q", [node.epoch_id for node in nodes.values()])
+        self.timestamps_ms = array("q", [node.timestamp_ms for node in nodes.values()])
+        index = self.index
+        self.parent_idx = array(
+            "q", [index.get(node.parent_id, -2) if node.parent_id else -1 for node in nodes.values()]
+        )
+        self.depths = _node_depths(self.parent_idx)
+
+
+def _depth(start: int, parent_idx: array, depths: array, visits: array, positions: array, stamp: int) -> int:
+    """Number of parent hops from node ``start`` (a parent cycle counts each member once).
+
+    ``depths`` holds -1 for unresolved nodes; every node walked is resolved in
+    place, so later calls stop at the first already-resolved ancestor. Cycle
+    detection reuses the caller's ``visits``/``positions`` buffers: a node is on
+    this call's path iff ``visits[node] == stamp``, so each call passes a fresh
+    stamp instead of allocating a visited set.
+    """
     depth = 0
-    cursor = nodes.get(node_id)
-    seen: set[str] = set()
-    while cursor and cursor.parent_id:
-        if cursor.node_id in seen:
+    path: List[int] = []
+    cursor = start
+    while True:
+        if depths[cursor] >= 0:
+            depth = depths[cursor]
             break
-        seen.add(cursor.node_id)
+        parent = parent_idx[cursor]
+        if parent < 0:
+            # Root, or a dangling parent reference that ends the walk one hop up
+            depth = 0 if parent == -1 else 1
+            depths[cursor] = depth
+            break
+        if visits[cursor] == stamp:
+            # Parent cycle: each member's walk visits the whole cycle once
+            start = positions[cursor]
+            depth = len(path) - start
+            for member in path[start:]:
+                depths[member] = depth
+            del path[start:]
+            break
+        visits[cursor] = stamp
+        positions[cursor] = len(path)
+        path.append(cursor)
+        cursor = parent
+    for cursor in reversed(path):
         depth += 1
-        cursor = nodes.get(cursor.parent_id)
+        depths[cursor] = depth
     return depth
 
 
-def _fault_delay_ms(faults: List[str]) -> int:
+def _node_depths(parent_idx: array) -> array:
+    """Depth of every node, assigned top-down by one BFS from the roots.
+
+    Nodes not reachable from a root hang off a parent cycle; those fall back
+    to ``_depth`` so they keep its cycle-length semantics.
+    """
+    count = len(parent_idx)
+    depths = array("q", [-1]) * count
+    children: List[List[int]] = [[] for _ in range(count)]
+    queue: deque[int] = deque()
+    for idx, parent in enumerate(parent_idx):
+        if parent >= 0:
+            children[parent].append(idx)
+        else:
+            depths[idx] = 0 if parent == -1 else 1
+            queue.append(idx)
+    resolved = len(queue)
+    while queue:
+        current = queue.popleft()
+        child_depth = depths[current] + 1
+        for child in children[current]:
+            depths[child] = child_depth
+            queue.append(child)
+            resolved += 1
+    if resolved < count:
+        visits = array("q", [0]) * count
+        positions = array("q", [0]) * count
+        stamp = 0
+        for idx in range(count):
+            if depths[idx] < 0:
+                stamp += 1
+                _depth(idx, parent_idx, depths, visits, positions, stamp)
+    return depths
+
+
+def _fault_delay_ms(faults: Sequence[str]) -> int:
     for fault in faults:
         if fault.startswith("delay_validation:"):
             try:
@@ -210,81 +369,111 @@ def _fault_delay_ms(faults: List[str]) -> int:
     return 0
 
 
-def _fault_drop(faults: List[str]) -> bool:
+def _fault_drop(faults: Sequence[str]) -> bool:
     return any(f == "drop_next_eare" for f in faults)
 
 
+_NO_FAULTS = (False, 0)
+
+
+@lru_cache(maxsize=256)
+def _classify_faults(faults: Tuple[str, ...]) -> Tuple[bool, int]:
+    """(drop_next_eare, delay_validation_ms) for an event's faults; corpora reuse a few fault lists."""
+    return _fault_drop(faults), _fault_delay_ms(faults)
+
+
 def simulate(scenario: Scenario) -> SimulationResult:
-    # Sort events deterministically
-    events = sorted(enumerate(scenario.events), key=lambda kv: (kv[1].t, kv[0]))
+    # Sort events deterministically (stable, so equal timestamps keep corpus order)
+    events = sorted(scenario.events, key=attrgetter("t"))
 
+    # Ordered (node_id, hash) issues per epoch_id, plus a hash set per epoch for O(1) fork checks
     observed_hashes: Dict[int, List[Tuple[str, str]]] = {}
-    children_by_parent: Dict[str, List[Tuple[int, str, str]]] = {}
+    observed_hash_sets: Dict[int, Set[str]] = {}
+    # (epoch_id, hash) pairs issued under each parent. Roots (None) and "" parents deliberately
+    # share the "" bucket: the Go, Node and Rust validators key it the same way.
+    children_by_parent: Dict[str, Set[Tuple[int, str]]] = {}
     detection_time: Optional[int] = None
     detection = False
     errors: List[str] = []
+    # Membership mirror of errors; the list keeps first-seen order for the report
+    error_set: Set[str] = set()
     messages_dropped = 0
     fork_created_time: Optional[int] = None
     winning_node_id: Optional[str] = None
-
-    for _, ev in events:
-        if ev.event == "epoch_issue":
-            if _fault_drop(ev.faults):
+    merge_event_time: Optional[int] = None
+
+    nodes = scenario.nodes
+    observed_setdefault = observed_hashes.setdefault
+    hash_sets_setdefault = observed_hash_sets.setdefault
+    children_setdefault = children_by_parent.setdefault
+
+    for ev in events:
+        # Three event kinds: a compare ladder on one local beats a handler-table call per event
+        kind = ev.event
+        if kind == "epoch_issue":
+            drop_next_eare, delay_validation_ms = _classify_faults(tuple(ev.faults)) if ev.faults else _NO_FAULTS
+            if drop_next_eare:
                 continue
-            if ev.node_id not in scenario.nodes:
+            node = nodes.get(ev.node_id)
+            if node is None:
                 raise CorpusError(f"Unknown node_id {ev.node_id} in scenario {scenario.scenario_id}")
-            node = scenario.nodes[ev.node_id]
-            epoch_entries = observed_hashes.setdefault(node.epoch_id, [])
-            known_hashes = {h for _, h in epoch_entries}
-            parent_children = children_by_parent.setdefault(node.parent_id or "", [])
-            parent_hashes = {(e_id, h) for e_id, _, h in parent_children}
+            epoch_entries = observed_setdefault(node.epoch_id, [])
+            known_hashes = hash_sets_setdefault(node.epoch_id, set())
+            parent_children = children_setdefault(node.parent_id or "", set())
+            child_key = (node.epoch_id, node.eare_hash)
 
-            fork_detected = False
             # Fork on same epoch_id with differing hashes
-            if node.eare_hash not in known_hashes and len(epoch_entries) >= 1:
-                fork_detected = True
+            fork_detected = bool(epoch_entries) and node.eare_hash not in known_hashes
             # Fork on divergent children from same parent even if epoch_id differs
-            if node.parent_id is not None:
-                already = {(e_id, h) for e_id, _, h in parent_children}
-                if (node.epoch_id, node.eare_hash) not in already and len(parent_children) >= 1:
-                    fork_detected = True
+            # (only consulted when the epoch check has not already fired)
+            if not fork_detected and node.parent_id is not None and parent_children:
+                fork_detected = child_key not in parent_children
 
             epoch_entries.append((node.node_id, node.eare_hash))
-            parent_children.append((node.epoch_id, node.node_id, node.eare_hash))
+            known_hashes.add(node.eare_hash)
+            parent_children.add(child_key)
 
             if fork_detected:
                 fork_created_time = fork_created_time or ev.t
                 if detection_time is None:
-                    detection_time = ev.t + _fault_delay_ms(ev.faults)
+                    detection_time = ev.t + delay_validation_ms
                     detection = True
-                    if "EPOCH_FORK_DETECTED" not in errors:
+                    if "EPOCH_FORK_DETECTED" not in error_set:
+                        error_set.add("EPOCH_FORK_DETECTED")
                         errors.append("EPOCH_FORK_DETECTED")
 
             # Hash-chain integrity check
             if node.previous_epoch_hash and node.parent_id:
-                parent = scenario.nodes.get(node.parent_id)
+                parent = nodes.get(node.parent_id)
                 if parent and parent.eare_hash != node.previous_epoch_hash:
-                    if "HASH_CHAIN_BREAK" not in errors:
+                    if "HASH_CHAIN_BREAK" not in error_set:
+                        error_set.add("HASH_CHAIN_BREAK")
                         errors.append("HASH_CHAIN_BREAK")
-        elif ev.event == "replay_attempt" and ev.count:
+        elif kind == "replay_attempt" and ev.count:
             messages_dropped += int(ev.count)
+        elif kind == "merge" and merge_event_time is None:
+            merge_event_time = ev.t
 
     # Choose winning branch (prefer longest depth, then earliest timestamp)
     winning_epoch_id = None
     winning_hash = None
     if observed_hashes:
+        table = scenario.node_table or _NodeTable(nodes)
+        index = table.index
+        depths = table.depths
+        epoch_ids = table.epoch_ids
+        timestamps_ms = table.timestamps_ms
+
         def key_fn(entry: Tuple[str, str]) -> Tuple[int, int, int, str]:
             node_id, e_hash = entry
-            node = scenario.nodes[node_id]
-            return (_depth(node_id, scenario.nodes), node.epoch_id, -node.timestamp_ms, e_hash)
+            idx = index[node_id]
+            return (depths[idx], epoch_ids[idx], -timestamps_ms[idx], e_hash)
 
-        all_entries: List[Tuple[str, str]] = []
-        for _, entries in observed_hashes.items():
-            all_entries.extend(entries)
-        if all_entries:
-            all_entries.sort(key=key_fn, reverse=True)
-            winning_node_id, winning_hash = all_entries[0]
-            winning_epoch_id = scenario.nodes[winning_node_id].epoch_id
+        # nlargest(1) keeps the first of equal keys, matching a stable reverse sort
+        top = nlargest(1, chain.from_iterable(observed_hashes.values()), key=key_fn)
+        if top:
+            winning_node_id, winning_hash = top[0]
+            winning_epoch_id = epoch_ids[index[winning_node_id]]
 
     detection_reference_time = None
     if scenario.expectations.detection_reference == "fork_observable":
@@ -298,7 +487,6 @@ def simulate(scenario: Scenario) -> SimulationResult:
 
     # Reconciliation
     reconciliation_ms: Optional[int] = None
-    merge_event_time = next((ev.t for _, ev in events if ev.event == "merge"), None)
     if detection_time is not None and merge_event_time is not None:
         reconciliation_ms = max(0, merge_event_time - detection_time)
 
@@ -318,6 +506,7 @@ def simulate(scenario: Scenario) -> SimulationResult:
         errors=errors,
         false_positives=false_positives,
         notes=notes,
+        errors_set=error_set,
     )
 
 
@@ -356,7 +545,8 @@ def evaluate_expectations(scenario: Scenario, result: SimulationResult) -> Tuple
     # Time-based replay gap enforcement would require timestamps; skipped for now.
 
     # error categories
-    missing_errors = [err for err in exp.expected_error_categories if err not in result.errors]
+    reported = result.errors_set or set(result.errors)
+    missing_errors = [err for err in exp.expected_error_categories if err not in reported]
     if missing_errors:
         failures.append("missing_error_categories")
 
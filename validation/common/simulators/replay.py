@@ -2,7 +2,52 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+try:  # optional JIT for the per-ms loop, which every profile runs; plain Python is the reference
+    from numba import njit
+except ImportError:
+    njit = None  # pragma: no cover - depends on environment
+
+Totals = Tuple[float, float, float, float, float]
+
+
+def _simulate_core(duration_ms: int, burst_rate: float, capacity_per_ms: float, queue_limit: float) -> Totals:
+    """Per-ms queue recurrence, summed step by step like the other language validators."""
+    pending = 0.0
+    processed = 0.0
+    dropped = 0.0
+    total_generated = 0.0
+    max_queue = 0.0
+    latency_integral = 0.0
+
+    for _ in range(duration_ms):
+        pending += burst_rate
+        total_generated += burst_rate
+
+        if capacity_per_ms > 0:
+            processed_now = min(pending, capacity_per_ms)
+        else:
+            processed_now = 0.0
+        pending -= processed_now
+        processed += processed_now
+
+        overflow = max(0.0, pending - queue_limit)
+        if overflow > 0:
+            pending -= overflow
+            dropped += overflow
+
+        if pending > max_queue:
+            max_queue = pending
+        latency_integral += pending
+
+    return total_generated, processed, dropped, max_queue, latency_integral
+
+
+if njit is not None:
+    # simulate() runs this loop for every profile, so long storms are where the JIT pays off.
+    # No fastmath: the oracle must keep IEEE semantics to match the other implementations.
+    _simulate_core = njit(cache=True)(_simulate_core)  # pragma: no cover - depends on environment
 
 
 @dataclass
@@ -36,32 +81,12 @@ class ReplayStormSimulator:
 
     def simulate(self, profile: ReplayProfile) -> Dict[str, Any]:
         queue_limit = profile.queue_limit or self.queue_limit
-        pending = 0.0
-        processed = 0.0
-        dropped = 0.0
-        total_generated = 0.0
-        max_queue = 0.0
-        latency_integral = 0.0
-
-        for _ in range(max(0, profile.duration_ms)):
-            pending += profile.burst_rate
-            total_generated += profile.burst_rate
-
-            if self.capacity_per_ms > 0:
-                processed_now = min(pending, self.capacity_per_ms)
-            else:
-                processed_now = 0.0
-            pending -= processed_now
-            processed += processed_now
-
-            overflow = max(0.0, pending - queue_limit)
-            if overflow > 0:
-                pending -= overflow
-                dropped += overflow
-
-            if pending > max_queue:
-                max_queue = pending
-            latency_integral += pending
+        # The per-ms accumulation is the reference: the Go and Rust validators sum the same way,
+        # and a closed form's exact totals can land on the other side of alert_threshold.
+        totals = _simulate_core(
+            max(0, profile.duration_ms), float(profile.burst_rate), self.capacity_per_ms, float(queue_limit)
+        )
+        total_generated, processed, dropped, max_queue, latency_integral = totals
 
         drop_ratio = dropped / total_generated if total_generated > 0 else 0.0
         delivery_ratio = processed / total_generated if total_generated > 0 else 0.0
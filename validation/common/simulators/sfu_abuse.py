@@ -2,23 +2,26 @@
 from __future__ import annotations
 
 import json
+import sys
+from collections.abc import Hashable
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
+from operator import attrgetter
+from typing import Any, Collection, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 
 class CorpusError(ValueError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Participant:
     pid: str
     role: str
-    tokens: List[str]
+    tokens: FrozenSet[str]
     tracks: List[Dict[str, Any]]
 
 
-@dataclass
+@dataclass(slots=True)
 class SFUContext:
     sfu_id: str
     room_id: str
@@ -26,14 +29,19 @@ class SFUContext:
     auth_mode: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     t: int
     event: str
     raw: Dict[str, Any]
+    # Payload fields read by most handlers, pulled out of ``raw`` once at parse time
+    participant: Any = None
+    token: Any = None
+    # Scenario-local small-int id of a string track_id; -1 if track_id is not a string
+    track: int = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class Expectations:
     should_detect: bool
     expected_errors: List[str]
@@ -48,7 +56,7 @@ class Expectations:
     max_false_negative_leaks: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     scenario_id: str
     tags: List[str]
@@ -58,7 +66,7 @@ class Scenario:
     expectations: Expectations
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResult:
     detection: bool
     detection_ms: Optional[int]
@@ -67,7 +75,8 @@ class SimulationResult:
     notes: List[str]
 
 
-ERROR_CODES = {
+# The SFU abuse error vocabulary; expected_errors is checked against it at parse time
+ERROR_CODES: FrozenSet[str] = frozenset({
     "UNAUTHORIZED_SUBSCRIBE",
     "IMPERSONATION",
     "KEY_LEAK_ATTEMPT",
@@ -77,7 +86,51 @@ ERROR_CODES = {
     "HIJACKED_TRACK",
     "SIMULCAST_SPOOF",
     "BITRATE_ABUSE",
-}
+})
+
+
+# Required keys, in the order missing ones are reported. The sets give valid
+# objects a single subset check; the ordered scan only runs to build the error.
+_SFU_CONTEXT_FIELDS = ("sfu_id", "room_id", "expected_participants", "auth_mode")
+_SFU_CONTEXT_FIELD_SET = frozenset(_SFU_CONTEXT_FIELDS)
+_EXPECTATION_FIELDS = (
+    "should_detect",
+    "expected_errors",
+    "max_detection_ms",
+    "allow_partial_accept",
+    "residual_routing_allowed",
+    "max_hijacked_tracks",
+    "max_unauthorized_tracks",
+    "max_key_leak_attempts",
+    "max_extra_latency_ms",
+    "max_false_positive_blocks",
+    "max_false_negative_leaks",
+)
+_EXPECTATION_FIELD_SET = frozenset(_EXPECTATION_FIELDS)
+
+
+_NO_LAYERS: FrozenSet[Any] = frozenset()
+
+
+def _layer_set(layers: Any) -> Collection[Any]:
+    """Published layers as a frozenset; a list is kept if a layer value is unhashable."""
+    if not isinstance(layers, list):
+        return _NO_LAYERS
+    try:
+        return frozenset(layers)
+    except TypeError:
+        return layers
+
+
+def _layers_allowed(allowed: Collection[Any], requested: Any) -> bool:
+    if type(allowed) is frozenset:
+        try:
+            return allowed.issuperset(requested)
+        except TypeError:
+            pass  # an unhashable requested layer (or a non-iterable request, which re-raises below)
+        # Unhashable values never compare equal to the hashable published layers
+        return all(isinstance(layer, Hashable) and layer in allowed for layer in requested)
+    return all(layer in allowed for layer in requested)
 
 
 def _schema_error(scenario_id: str, detail: str) -> CorpusError:
@@ -91,27 +144,28 @@ def _validate_participants(data: Any, scenario_id: str) -> Dict[str, Participant
     for entry in data:
         if not isinstance(entry, dict):
             raise _schema_error(scenario_id, "participant entry must be object")
-        pid = entry.get("id")
+        get = entry.get
+        pid = get("id")
         if not isinstance(pid, str) or not pid:
             raise _schema_error(scenario_id, "participant id must be string")
-        role = entry.get("role", "subscriber")
-        tokens = entry.get("authz_tokens", [])
-        tracks = entry.get("tracks", [])
+        role = get("role", "subscriber")
+        tokens = get("authz_tokens", [])
+        tracks = get("tracks", [])
         if not isinstance(tokens, list):
             raise _schema_error(scenario_id, f"participant {pid} tokens must be array")
         if not isinstance(tracks, list):
             raise _schema_error(scenario_id, f"participant {pid} tracks must be array")
-        out[pid] = Participant(pid=pid, role=str(role), tokens=[str(t) for t in tokens], tracks=tracks)
+        out[pid] = Participant(pid, str(role), frozenset(map(str, tokens)), tracks)
     return out
 
 
 def _validate_sfu_context(data: Any, scenario_id: str) -> SFUContext:
     if not isinstance(data, dict):
         raise _schema_error(scenario_id, "sfu_context must be object")
-    required = ["sfu_id", "room_id", "expected_participants", "auth_mode"]
-    for field in required:
-        if field not in data:
-            raise _schema_error(scenario_id, f"sfu_context missing {field}")
+    if not data.keys() >= _SFU_CONTEXT_FIELD_SET:
+        for field in _SFU_CONTEXT_FIELDS:
+            if field not in data:
+                raise _schema_error(scenario_id, f"sfu_context missing {field}")
     if not isinstance(data.get("expected_participants"), list):
         raise _schema_error(scenario_id, "expected_participants must be array")
     return SFUContext(
@@ -126,40 +180,49 @@ def _validate_events(data: Any, scenario_id: str) -> List[Event]:
     if not isinstance(data, list) or not data:
         raise _schema_error(scenario_id, "timeline must be non-empty array")
     events: List[Event] = []
+    append = events.append
+    track_ids: Dict[str, int] = {}
+    track_setdefault = track_ids.setdefault
     for idx, raw in enumerate(data):
         if not isinstance(raw, dict):
             raise _schema_error(scenario_id, "timeline entry must be object")
         if "event" not in raw or "t" not in raw:
             raise _schema_error(scenario_id, f"timeline[{idx}] missing event or t")
-        if not isinstance(raw["t"], int):
+        t = raw["t"]
+        if not isinstance(t, int):
             raise _schema_error(scenario_id, f"timeline[{idx}] t must be int")
-        events.append(Event(t=int(raw["t"]), event=str(raw["event"]), raw=raw))
-    events.sort(key=lambda e: (e.t, e.event))
+        get = raw.get
+        track_id = get("track_id")
+        # Interned so the dispatch ladder in simulate() compares event names by identity;
+        # positional, in field order, to skip building a kwargs dict per event
+        append(
+            Event(
+                int(t),
+                sys.intern(str(raw["event"])),
+                raw,
+                get("participant"),
+                get("token"),
+                track_setdefault(track_id, len(track_ids)) if isinstance(track_id, str) else -1,
+            )
+        )
+    events.sort(key=attrgetter("t", "event"))
     return events
 
 
 def _validate_expectations(data: Any, scenario_id: str) -> Expectations:
     if not isinstance(data, dict):
         raise _schema_error(scenario_id, "expectations must be object")
-    required = [
-        "should_detect",
-        "expected_errors",
-        "max_detection_ms",
-        "allow_partial_accept",
-        "residual_routing_allowed",
-        "max_hijacked_tracks",
-        "max_unauthorized_tracks",
-        "max_key_leak_attempts",
-        "max_extra_latency_ms",
-        "max_false_positive_blocks",
-        "max_false_negative_leaks",
-    ]
-    for field in required:
-        if field not in data:
-            raise _schema_error(scenario_id, f"expectations missing {field}")
+    if not data.keys() >= _EXPECTATION_FIELD_SET:
+        for field in _EXPECTATION_FIELDS:
+            if field not in data:
+                raise _schema_error(scenario_id, f"expectations missing {field}")
+    expected_errors = [str(e) for e in data.get("expected_errors", [])]
+    unknown = [code for code in expected_errors if code not in ERROR_CODES]
+    if unknown:
+        raise _schema_error(scenario_id, f"expectations.expected_errors has unknown codes {unknown}")
     return Expectations(
         should_detect=bool(data["should_detect"]),
-        expected_errors=[str(e) for e in data.get("expected_errors", [])],
+        expected_errors=expected_errors,
         max_detection_ms=int(data["max_detection_ms"]),
         allow_partial_accept=bool(data["allow_partial_accept"]),
         residual_routing_allowed=bool(data["residual_routing_allowed"]),
@@ -191,24 +254,41 @@ def parse_scenario(raw: Dict[str, Any]) -> Scenario:
     )
 
 
-def load_corpus(path: str) -> List[Scenario]:
+def iter_corpus(path: str) -> Iterator[Scenario]:
+    """Parse the corpus one scenario at a time as the caller reaches it."""
     with open(path, "r", encoding="utf-8") as handle:
         data = json.load(handle)
     if not isinstance(data, list):
         raise CorpusError("corpus root must be array")
-    return [parse_scenario(entry) for entry in data]
+    for entry in data:
+        yield parse_scenario(entry)
+
+
+def load_corpus(path: str) -> List[Scenario]:
+    return list(iter_corpus(path))
 
 
 def simulate(scenario: Scenario) -> SimulationResult:
+    # First-seen order for the report, plus a set for O(1) dedup
     errors: List[str] = []
+    errors_set: Set[str] = set()
     notes: List[str] = []
 
+    detection_time: Optional[int] = None
+    t = 0
+
     def add_error(code: str) -> None:
-        if code not in errors:
+        nonlocal detection_time
+        if code not in errors_set:
+            errors_set.add(code)
             errors.append(code)
+            # The first error of the run fixes the detection time at the current event
+            if detection_time is None:
+                detection_time = t
 
     authed: Set[str] = set()
-    room_expected = set(scenario.sfu_context.expected_participants)
+    # Counters stay plain locals: an increment is a fast-local store (counts this small
+    # come from the small-int cache), several times cheaper than indexing a packed array
     key_leak_attempts = 0
     hijacked_tracks = 0
     unauthorized_tracks = 0
@@ -220,10 +300,11 @@ def simulate(scenario: Scenario) -> SimulationResult:
     false_negative_leaks = 0
     affected_participants: Set[str] = set()
 
-    routes: Dict[str, str] = {}  # track_id -> participant id
-    track_layers: Dict[str, List[str]] = {}
+    # Keyed by Event.track, so lookups hash small ints rather than track_id strings
+    routes: Dict[int, str] = {}  # track -> participant id
+    track_layers: Dict[int, Collection[Any]] = {}
 
-    detection_time: Optional[int] = None
+    participants = scenario.participants
 
     for ev in scenario.events:
         e = ev.event
@@ -232,74 +313,70 @@ def simulate(scenario: Scenario) -> SimulationResult:
 
         # join
         if e == "join":
-            pid = payload.get("participant")
-            token = payload.get("token")
-            if pid not in scenario.participants:
+            pid = ev.participant
+            token = ev.token
+            part = participants.get(pid)
+            if part is None:
                 add_error("UNAUTHORIZED_SUBSCRIBE")
                 unauthorized_tracks += 1
             else:
-                part = scenario.participants[pid]
-                if token not in part.tokens:
+                # Tokens are strings; anything else (possibly unhashable) cannot match
+                if type(token) is not str or token not in part.tokens:
                     add_error("IMPERSONATION")
                 else:
                     authed.add(pid)
 
         elif e == "publish":
-            pid = payload.get("participant")
-            track_id = payload.get("track_id")
+            pid = ev.participant
+            track = ev.track
             layers = payload.get("layers", [])
-            if not isinstance(pid, str) or not isinstance(track_id, str):
+            if not isinstance(pid, str) or track < 0:
                 add_error("UNAUTHORIZED_SUBSCRIBE")
                 unauthorized_tracks += 1
             elif pid not in authed:
                 add_error("UNAUTHORIZED_SUBSCRIBE")
                 unauthorized_tracks += 1
             else:
-                routes[track_id] = pid
-                track_layers[track_id] = layers if isinstance(layers, list) else []
+                routes[track] = pid
+                track_layers[track] = _layer_set(layers)
 
         elif e == "subscribe":
-            pid = payload.get("participant")
-            track_id = payload.get("track_id")
-            if not isinstance(pid, str) or not isinstance(track_id, str):
+            pid = ev.participant
+            track = ev.track
+            if not isinstance(pid, str) or track < 0:
                 add_error("UNAUTHORIZED_SUBSCRIBE")
                 unauthorized_tracks += 1
             elif pid not in authed:
                 add_error("UNAUTHORIZED_SUBSCRIBE")
                 unauthorized_tracks += 1
-            elif track_id not in routes:
+            elif track not in routes:
                 add_error("UNAUTHORIZED_SUBSCRIBE")
                 unauthorized_tracks += 1
 
         elif e == "ghost_subscribe":
-            pid = payload.get("participant")
-            track_id = payload.get("track_id")
+            pid = ev.participant
             add_error("UNAUTHORIZED_SUBSCRIBE")
             unauthorized_tracks += 1
             affected_participants.add(pid or "ghost")
 
         elif e == "impersonate":
-            pid = payload.get("participant")
+            pid = ev.participant
             add_error("IMPERSONATION")
             affected_participants.add(pid or "unknown")
 
         elif e == "replay_track":
-            track_id = payload.get("track_id")
-            if track_id in routes:
+            if ev.track in routes:
                 add_error("REPLAY_TRACK")
                 replayed_tracks += 1
 
         elif e == "dup_track":
-            track_id = payload.get("track_id")
-            if track_id in routes:
+            if ev.track in routes:
                 add_error("DUPLICATE_ROUTE")
                 duplicate_routes += 1
 
         elif e == "simulcast_spoof":
-            track_id_val = payload.get("track_id")
             requested_layers = payload.get("requested_layers", [])
-            allowed = track_layers.get(track_id_val, []) if isinstance(track_id_val, str) else []
-            if any(layer not in allowed for layer in requested_layers):
+            if not _layers_allowed(track_layers.get(ev.track, _NO_LAYERS), requested_layers):
                 add_error("SIMULCAST_SPOOF")
                 simulcast_spoofs += 1
 
@@ -315,20 +392,18 @@ def simulate(scenario: Scenario) -> SimulationResult:
             add_error("KEY_LEAK_ATTEMPT")
             key_leak_attempts += 1
 
-        # latency impact / detection time
-        if errors and detection_time is None:
-            detection_time = t
-
+    # evaluate_expectations reads only some of these, but every key is part of the
+    # summary JSON compared against the Go/Node/Rust runners, so all are kept
     metrics = {
         "unauthorized_tracks": unauthorized_tracks,
         "hijacked_tracks": hijacked_tracks,
-        "impersonation_attempts": 1 if "IMPERSONATION" in errors else 0,
+        "impersonation_attempts": 1 if "IMPERSONATION" in errors_set else 0,
         "key_leak_attempts": key_leak_attempts,
         "duplicate_routes": duplicate_routes,
         "replayed_tracks": replayed_tracks,
         "simulcast_spoofs": simulcast_spoofs,
         "bitrate_abuse_events": bitrate_abuse_events,
-        "accepted_tracks": len([k for k, v in routes.items() if v]),
+        "accepted_tracks": sum(1 for v in routes.values() if v),
         "rejected_tracks": unauthorized_tracks,
         "false_positive_blocks": false_positive_blocks,
         "false_negative_leaks": false_negative_leaks,
@@ -394,6 +469,7 @@ __all__ = [
     "SFUContext",
     "Participant",
     "Event",
+    "iter_corpus",
     "load_corpus",
     "parse_scenario",
     "simulate",
@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bufio"
 	"encoding/json"
 	"flag"
 	"fmt"
@@ -406,9 +407,37 @@ func contains(arr []string, target string) bool {
 	return false
 }
 
+// serveDaemon answers every scenario id read from stdin with exactly one JSON
+// line (the envelope, or {"error": ...}), so a coordinator can reuse one
+// process, and one `go run` build, for a whole corpus.
+func serveDaemon(scenarios []Scenario, enc *json.Encoder) {
+	byID := make(map[string]Scenario, len(scenarios))
+	for _, s := range scenarios {
+		if _, dup := byID[s.ScenarioID]; !dup {
+			byID[s.ScenarioID] = s
+		}
+	}
+	scanner := bufio.NewScanner(os.Stdin)
+	for scanner.Scan() {
+		var out any
+		if s, ok := byID[strings.TrimSpace(scanner.Text())]; !ok {
+			out = map[string]string{"error": "no matching scenario"}
+		} else if env, simErr := simulate(s); simErr != nil {
+			out = map[string]string{"error": fmt.Sprintf("simulate failed: %v", simErr)}
+		} else {
+			out = env
+		}
+		if err := enc.Encode(out); err != nil {
+			fmt.Fprintf(os.Stderr, "encode failed: %v\n", err)
+			os.Exit(1)
+		}
+	}
+}
+
 func main() {
 	corpusPath := flag.String("corpus", "tests/common/adversarial/epoch_forks.json", "path to corpus")
 	scenarioID := flag.String("scenario", "", "scenario id to run (optional)")
+	daemon := flag.Bool("daemon", false, "read scenario ids from stdin and answer each with one envelope line")
 	flag.Parse()
 
 	scenarios, err := loadCorpus(*corpusPath)
@@ -419,6 +448,10 @@ func main() {
 	enc := json.NewEncoder(os.Stdout)
 	enc.SetEscapeHTML(false)
 	enc.SetIndent("", "")
+	if *daemon {
+		serveDaemon(scenarios, enc)
+		os.Exit(0)
+	}
 	encoded := false
 	for _, s := range scenarios {
 		if *scenarioID != "" && s.ScenarioID != *scenarioID {
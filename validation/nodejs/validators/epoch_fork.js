@@ -1,6 +1,7 @@
 #!/usr/bin/env node
 const fs = require('fs');
 const path = require('path');
+const readline = require('readline');
 const { inputPath } = require('../util/reporting');
 
 function loadCorpus(p) {
@@ -185,10 +186,35 @@ function runScenario(scenario) {
   };
 }
 
+// Answers every scenario id read from stdin with exactly one JSON line (the
+// envelope, or {"error": ...}), so a coordinator can reuse one process.
+function serveDaemon(corpus) {
+  const byId = new Map();
+  for (const scenario of corpus) {
+    if (!byId.has(scenario.scenario_id)) byId.set(scenario.scenario_id, scenario);
+  }
+  const rl = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+  rl.on('line', (line) => {
+    const scenario = byId.get(line.trim());
+    let out;
+    if (!scenario) {
+      out = { error: 'No matching scenarios' };
+    } else {
+      try {
+        out = runScenario(scenario);
+      } catch (err) {
+        out = { error: String(err && err.message ? err.message : err) };
+      }
+    }
+    process.stdout.write(`${JSON.stringify(out)}\n`);
+  });
+}
+
 function main() {
   const argv = process.argv.slice(2);
   let corpusPath = 'tests/common/adversarial/epoch_forks.json';
   let scenarioId = null;
+  let daemon = false;
   for (let i = 0; i < argv.length; i++) {
     const arg = argv[i];
     if (arg === '--corpus' && i + 1 < argv.length) {
@@ -197,9 +223,15 @@ function main() {
     } else if (arg === '--scenario' && i + 1 < argv.length) {
       scenarioId = argv[i + 1];
       i += 1;
+    } else if (arg === '--daemon') {
+      daemon = true;
     }
   }
   const corpus = loadCorpus(corpusPath);
+  if (daemon) {
+    serveDaemon(corpus);
+    return;
+  }
   const selected = scenarioId ? corpus.filter((s) => s.scenario_id === scenarioId) : corpus;
   if (selected.length === 0) {
     console.error('No matching scenarios');
@@ -3,23 +3,32 @@
 
 from __future__ import annotations
 
+import importlib
 import json
 import sys
-from importlib import util as importlib_util
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 ROOT_DIR = Path(__file__).resolve().parents[3]
-VALIDATOR_PATH = ROOT_DIR / "validation" / "python" / "validators" / "validate_cbor_python.py"
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+VALIDATOR_MODULE = "validation.python.validators.validate_cbor_python"
 
 
 def load_validator():
-    spec = importlib_util.spec_from_file_location("validate_cbor_python", VALIDATOR_PATH)
-    if spec is None or spec.loader is None:
-        raise RuntimeError("Unable to load validate_cbor_python module")
-    module = importlib_util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+    return importlib.import_module(VALIDATOR_MODULE)
+
+
+_VALIDATOR: Optional[Any] = None
+
+
+def _get_validator():
+    """Load the validator once per process; persistent-mode fuzzers call in a loop."""
+    global _VALIDATOR
+    if _VALIDATOR is None:
+        _VALIDATOR = load_validator()
+    return _VALIDATOR
 
 
 def process_payload(payload: Dict[str, Any], validator) -> None:
@@ -32,16 +41,19 @@ def process_payload(payload: Dict[str, Any], validator) -> None:
     validator.validate_message(message_type, vector)
 
 
-def main() -> None:
-    data = sys.stdin.buffer.read()
+def LLVMFuzzerTestOneInput(data: bytes) -> int:
     if not data:
-        return
+        return 0
     try:
         payload = json.loads(data.decode("utf-8", errors="ignore"))
     except json.JSONDecodeError:
-        return
-    validator = load_validator()
-    process_payload(payload, validator)
+        return 0
+    process_payload(payload, _get_validator())
+    return 0
+
+
+def main() -> None:
+    LLVMFuzzerTestOneInput(sys.stdin.buffer.read())
 
 
 if __name__ == "__main__":
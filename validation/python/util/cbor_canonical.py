@@ -2,28 +2,89 @@ from __future__ import annotations
 
 import base64
 import hashlib
+from functools import lru_cache
 from typing import Any
 
 import cbor2
 
 # Canonical CBOR encoder with explicit map-key sorting by encoded key bytes
 # (shortest first, then lexicographic) to mirror RFC 8949 ordering.
+#
+# Containers and common scalars are written in a single pass into one
+# bytearray; any other value (floats, bignums, tuples, tagged types, ...) is
+# handed to cbor2's canonical encoder as a leaf.
 
-def _canonicalize(value: Any) -> Any:
-    if isinstance(value, list):
-        return [_canonicalize(v) for v in value]
-    if isinstance(value, dict):
+
+def _encode_head(major: int, length: int, buf: bytearray) -> None:
+    initial = major << 5
+    if length < 24:
+        buf.append(initial | length)
+    elif length < 0x100:
+        buf.append(initial | 24)
+        buf.append(length)
+    elif length < 0x10000:
+        buf.append(initial | 25)
+        buf += length.to_bytes(2, "big")
+    elif length < 0x100000000:
+        buf.append(initial | 26)
+        buf += length.to_bytes(4, "big")
+    else:
+        buf.append(initial | 27)
+        buf += length.to_bytes(8, "big")
+
+
+def _encode(value: Any, buf: bytearray) -> None:
+    kind = type(value)
+    if kind is str:
+        data = value.encode("utf-8")
+        _encode_head(3, len(data), buf)
+        buf += data
+    elif kind is int and -0x10000000000000000 <= value < 0x10000000000000000:
+        if value >= 0:
+            _encode_head(0, value, buf)
+        else:
+            _encode_head(1, -1 - value, buf)
+    elif kind is bool:
+        buf.append(0xF5 if value else 0xF4)
+    elif value is None:
+        buf.append(0xF6)
+    elif kind is bytes:
+        _encode_head(2, len(value), buf)
+        buf += value
+    elif isinstance(value, dict):
         items = []
         for k, v in value.items():
-            k_c = _canonicalize(k)
-            v_c = _canonicalize(v)
-            key_bytes = cbor2.dumps(k_c, canonical=True)
-            items.append((key_bytes, k_c, v_c))
+            if type(k) in _CACHEABLE_KEY_TYPES:
+                items.append((_encode_key(k), v))
+            else:
+                key_buf = bytearray()
+                _encode(k, key_buf)
+                items.append((bytes(key_buf), v))
         items.sort(key=lambda entry: (len(entry[0]), entry[0]))
-        return {k: v for (_, k, v) in items}
-    return value
+        _encode_head(5, len(items), buf)
+        for key_bytes, v in items:
+            buf += key_bytes
+            _encode(v, buf)
+    elif isinstance(value, list):
+        _encode_head(4, len(value), buf)
+        for item in value:
+            _encode(item, buf)
+    else:
+        buf += cbor2.dumps(value, canonical=True)
+
+
+_CACHEABLE_KEY_TYPES = frozenset({str, int, bytes, bool, type(None)})
+
+
+# typed=True keeps 1 and True (equal and same hash) in separate entries
+@lru_cache(maxsize=4096, typed=True)
+def _encode_key(key: Any) -> bytes:
+    buf = bytearray()
+    _encode(key, buf)
+    return bytes(buf)
 
 
 def encode_canonical(obj: Any) -> bytes:
-    canon = _canonicalize(obj)
-    return cbor2.dumps(canon, canonical=True)
+    buf = bytearray()
+    _encode(obj, buf)
+    return bytes(buf)
@@ -1,14 +1,35 @@
 from __future__ import annotations
 
 import json
+import math
 from pathlib import Path
 from typing import Any, Dict, TypeVar
 
+try:  # optional fast JSON encoder; stdlib json is the reference fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 ROOT_DIR = Path(__file__).resolve().parents[3]
 RESULTS_DIR = ROOT_DIR / "results"
 
 T = TypeVar("T")
 
+# orjson serializes these natively where stdlib json raises; passing them through sends the
+# payload to the stdlib fallback, so both paths reject it the same way
+ORJSON_STDLIB_OPTIONS = (orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson is not None else 0
+
+
+def has_non_finite(value: Any) -> bool:
+    """True if ``value`` holds a NaN or infinite float, which orjson would write as null."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(has_non_finite(item) for item in value)
+    return False
+
 
 def ensure_results_dir() -> Path:
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -21,11 +42,20 @@ def write_json(filename: str, payload: Any) -> Path:
     output_dir = ensure_results_dir()
     output_path = output_dir / filename
     if isinstance(payload, dict):
+        # Shallow merge: copies only the top-level keys (summaries keep their scenarios in one
+        # nested list), and keeps crypto_profile as the first key in the written report.
         to_write = payload if "crypto_profile" in payload else {"crypto_profile": DEFAULT_CRYPTO_PROFILE, **payload}
     elif isinstance(payload, list):
         to_write = {"crypto_profile": DEFAULT_CRYPTO_PROFILE, "results": payload}
     else:
         to_write = {"crypto_profile": DEFAULT_CRYPTO_PROFILE, "value": payload}
+    if orjson is not None and not has_non_finite(to_write):
+        option = ORJSON_STDLIB_OPTIONS | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        try:
+            output_path.write_bytes(orjson.dumps(to_write, option=option))
+            return output_path
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; let stdlib json handle (or reject) the payload
     with output_path.open("w", encoding="utf-8") as handle:
         json.dump(to_write, handle, indent=2)
     return output_path
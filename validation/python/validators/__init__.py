@@ -0,0 +1 @@
+"""Python validator and simulator command line entry points."""
@@ -0,0 +1,193 @@
+"""Shared command line for the adversarial corpus simulator CLIs.
+
+The simulator module is imported only after arguments are parsed, so ``--help``
+stays cheap, and ``--corpus`` takes several paths so one interpreter can work
+through a batch of corpora.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+# (scenario, SimulationResult or the module's CorpusError)
+Outcome = Tuple[Any, Any]
+OutcomeFn = Callable[[ModuleType, Path, argparse.Namespace], Iterable[Outcome]]
+
+
+def build_parser(description: str, label: str, default_corpus: Path, summary_filename: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        nargs="+",
+        default=[default_corpus],
+        help=f"Path(s) to {label} corpus JSON; several paths are run in one process",
+    )
+    parser.add_argument(
+        "--summary-out",
+        default=summary_filename,
+        help="Summary filename (written to results/); with several corpora each name gets the corpus stem appended",
+    )
+    parser.add_argument("--fail-fast", action="store_true", help="Stop after first failing scenario (runs serially)")
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Worker processes for simulation (1 = serial, 0 = one per CPU)"
+    )
+    return parser
+
+
+def max_workers(args: argparse.Namespace) -> Optional[int]:
+    """Worker count for ``args``: ``None`` means one per CPU, 1 means serial."""
+    if args.fail_fast:
+        # Stopping early needs scenarios simulated in order, one at a time
+        return 1
+    return args.jobs or None
+
+
+def _simulate_one(sim_module: str, scenario: Any) -> Any:
+    module = importlib.import_module(sim_module)
+    try:
+        return module.simulate(scenario)
+    except module.CorpusError as exc:
+        return exc
+
+
+def simulate_each(module: ModuleType, corpus_path: Path, args: argparse.Namespace) -> Iterator[Outcome]:
+    workers = max_workers(args)
+    if workers is not None and workers <= 1:
+        # Scenarios are parsed lazily, so only the one being simulated is held as a Scenario
+        for scenario in module.iter_corpus(str(corpus_path)):
+            try:
+                yield scenario, module.simulate(scenario)
+            except module.CorpusError as exc:
+                yield scenario, exc
+        return
+    # simulate is pure per scenario; map keeps results in corpus order
+    scenarios = list(module.iter_corpus(str(corpus_path)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from zip(scenarios, pool.map(partial(_simulate_one, module.__name__), scenarios, chunksize=16))
+
+
+def summary_name(summary_out: str, corpus_path: Path, batch: bool) -> str:
+    if not batch:
+        return summary_out
+    out = Path(summary_out)
+    return str(out.with_name(f"{out.stem}_{corpus_path.stem}{out.suffix}"))
+
+
+def run_corpus(
+    module: ModuleType,
+    outcomes: Iterable[Outcome],
+    corpus_path: Path,
+    summary_out: str,
+    label: str,
+    fail_fast: bool = False,
+) -> int:
+    from validation.python.util.reporting import write_json  # type: ignore[import]
+
+    corpus_error = module.CorpusError
+    evaluate_expectations = module.evaluate_expectations
+    results: List[dict] = []
+    failed = 0
+
+    for scenario, sim_result in outcomes:
+        if not isinstance(sim_result, corpus_error):
+            try:
+                status, expectation_failures = evaluate_expectations(scenario, sim_result)
+            except corpus_error as exc:
+                sim_result = exc
+        if isinstance(sim_result, corpus_error):
+            failed += 1
+            results.append(
+                {
+                    "scenario_id": getattr(scenario, "scenario_id", "unknown"),
+                    "status": "fail",
+                    "failures": [str(sim_result)],
+                    "errors": [str(sim_result)],
+                    "metrics": {},
+                    "notes": [],
+                }
+            )
+            if fail_fast:
+                break
+            continue
+
+        if status != "pass":
+            failed += 1
+
+        results.append(
+            {
+                "scenario_id": scenario.scenario_id,
+                "status": status,
+                "failures": expectation_failures,
+                "errors": sim_result.errors,
+                "metrics": sim_result.metrics,
+                "notes": sim_result.notes,
+            }
+        )
+
+        if fail_fast and status != "pass":
+            break
+
+    summary = {
+        "corpus": str(corpus_path),
+        "total": len(results),
+        "failed": failed,
+        "passed": len(results) - failed,
+        "scenarios": results,
+    }
+
+    output_path = write_json(summary_out, summary)
+    print(f"{label[:1].upper()}{label[1:]} simulation summary written to {output_path}")
+    if failed:
+        print(f"❌ {failed} scenario(s) failed expectations")
+    else:
+        print(f"✅ All {label} scenarios passed")
+
+    return 0 if failed == 0 else 1
+
+
+def run(
+    sim_module: str,
+    default_corpus: Path,
+    summary_filename: str,
+    *,
+    label: str,
+    description: str,
+    args: Optional[argparse.Namespace] = None,
+    outcomes: OutcomeFn = simulate_each,
+) -> int:
+    """Run ``sim_module`` over every ``--corpus`` path and write one summary per corpus.
+
+    ``args`` lets a CLI parse its own extra flags first (starting from
+    ``build_parser``); otherwise the standard flags are parsed here. Returns 1 if
+    any corpus had a failing scenario or a corpus error.
+    """
+    if args is None:
+        args = build_parser(description, label, default_corpus, summary_filename).parse_args()
+    module = importlib.import_module(sim_module)
+
+    batch = len(args.corpus) > 1
+    rc = 0
+    for corpus_path in args.corpus:
+        try:
+            corpus_rc = run_corpus(
+                module,
+                outcomes(module, corpus_path, args),
+                corpus_path,
+                summary_name(args.summary_out, corpus_path, batch),
+                label,
+                fail_fast=args.fail_fast,
+            )
+        except module.CorpusError as exc:
+            print(f"Corpus error: {exc}", file=sys.stderr)
+            corpus_rc = 1
+        rc = max(rc, corpus_rc)
+        if rc and args.fail_fast:
+            break
+    return rc
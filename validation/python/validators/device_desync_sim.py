@@ -3,86 +3,35 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from types import ModuleType
+from typing import Any, Iterable, Tuple
 
 ROOT_DIR = Path(__file__).resolve().parents[3]
 if str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
-from validation.common.simulators.desync import (  # type: ignore[import]
-    CorpusError,
-    evaluate_expectations,
-    load_corpus,
-    parse_scenario,
-    simulate,
-)
-from validation.python.util.reporting import write_json  # type: ignore[import]
+from validation.python.validators._sim_cli import build_parser, max_workers, run  # type: ignore[import]
 
+SIM_MODULE = "validation.common.simulators.desync"
 DEFAULT_CORPUS = ROOT_DIR / "tests/common/adversarial/device_desync.json"
 SUMMARY_FILENAME = "device_desync_summary.json"
+LABEL = "device desync"
+DESCRIPTION = "Run device desynchronization simulations"
 
 
-def run_simulation(corpus_path: Path, summary_out: str, fail_fast: bool = False) -> int:
-    scenarios = load_corpus(str(corpus_path))
-    results: List[dict] = []
-    failed = 0
-
-    for scenario in scenarios:
-        try:
-            sim_result = simulate(scenario)
-            status, expectation_failures = evaluate_expectations(scenario, sim_result)
-        except CorpusError as exc:
-            failed += 1
-            results.append(
-                {
-                    "scenario_id": getattr(scenario, "scenario_id", "unknown"),
-                    "status": "fail",
-                    "failures": [str(exc)],
-                    "errors": [str(exc)],
-                    "metrics": {},
-                    "notes": [],
-                }
-            )
-            if fail_fast:
-                break
-            continue
-
-        if status != "pass":
-            failed += 1
-
-        results.append(
-            {
-                "scenario_id": scenario.scenario_id,
-                "status": status,
-                "failures": expectation_failures,
-                "errors": sim_result.errors,
-                "metrics": sim_result.metrics,
-                "notes": sim_result.notes,
-            }
-        )
-
-        if fail_fast and status != "pass":
-            break
-
-    summary = {
-        "corpus": str(corpus_path),
-        "total": len(results),
-        "failed": failed,
-        "passed": len(results) - failed,
-        "scenarios": results,
-    }
-
-    output_path = write_json(summary_out, summary)
-    print(f"Device desync simulation summary written to {output_path}")
-    if failed:
-        print(f"❌ {failed} scenario(s) failed expectations")
-    else:
-        print("✅ All device desync scenarios passed")
-
-    return 0 if failed == 0 else 1
+def _outcomes(module: ModuleType, corpus_path: Path, args: argparse.Namespace) -> Iterable[Tuple[Any, Any]]:
+    load = module.load_corpus_cached if args.corpus_cache else module.load_corpus
+    scenarios = load(str(corpus_path))
+    return zip(scenarios, module.simulate_corpus(scenarios, max_workers=max_workers(args)))
 
 
 def _inline_sanity_check() -> Tuple[bool, str]:
+    from validation.common.simulators.desync import (  # type: ignore[import]
+        evaluate_expectations,
+        parse_scenario,
+        simulate,
+    )
+
     scenario_data = {
         "scenario_id": "inline_health_check",
         "devices": [
@@ -116,11 +65,14 @@ def _inline_sanity_check() -> Tuple[bool, str]:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Run device desynchronization simulations")
-    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="Path to device desync corpus JSON")
-    parser.add_argument("--summary-out", default=SUMMARY_FILENAME, help="Summary filename (written to results/)")
-    parser.add_argument("--fail-fast", action="store_true", help="Stop after first failing scenario")
+    parser = build_parser(DESCRIPTION, LABEL, DEFAULT_CORPUS, SUMMARY_FILENAME)
     parser.add_argument("--self-test", action="store_true", help="Run inline sanity checks and exit")
+    parser.add_argument("--workers", dest="jobs", type=int, default=argparse.SUPPRESS, help="Alias for --jobs")
+    parser.add_argument(
+        "--corpus-cache",
+        action="store_true",
+        help="Reuse parsed corpora pickled in a private per-user cache (~/.cache/foxwhisper/desync)",
+    )
     args = parser.parse_args()
 
     if args.self_test:
@@ -128,11 +80,15 @@ def main() -> int:
         print(msg)
         return 0 if ok else 1
 
-    try:
-        return run_simulation(args.corpus, args.summary_out, fail_fast=args.fail_fast)
-    except CorpusError as exc:
-        print(f"Corpus error: {exc}", file=sys.stderr)
-        return 1
+    return run(
+        SIM_MODULE,
+        DEFAULT_CORPUS,
+        SUMMARY_FILENAME,
+        label=LABEL,
+        description=DESCRIPTION,
+        args=args,
+        outcomes=_outcomes,
+    )
 
 
 if __name__ == "__main__":
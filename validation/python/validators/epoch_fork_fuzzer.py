@@ -6,14 +6,23 @@ import json
 import os
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from time import perf_counter
+from typing import Any, BinaryIO, Dict, List, Optional, Set
+
+try:  # optional fast JSON encoder; stdlib json is the reference fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 if str(REPO_ROOT) not in sys.path:
     sys.path.append(str(REPO_ROOT))
 
 from validation.common.simulators import epoch as epoch_mod  # type: ignore[import]
+from validation.python.util.reporting import ORJSON_STDLIB_OPTIONS, has_non_finite  # type: ignore[import]
 
 CorpusError = epoch_mod.CorpusError
 evaluate_expectations = epoch_mod.evaluate_expectations
@@ -25,65 +34,46 @@ DEFAULT_SUMMARY = Path("results/epoch_fork_summary.json")
 DEFAULT_ENVELOPES = Path("results/epoch_fork_envelopes.jsonl")
 
 
+_CREATED_DIRS: Set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path in _CREATED_DIRS:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _CREATED_DIRS.add(path)
+
+
+def _dumps(data: Any, *, indent: bool = False) -> bytes:
+    if orjson is not None and not has_non_finite(data):
+        option = ORJSON_STDLIB_OPTIONS | orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; let stdlib json handle (or reject) the payload
+    return json.dumps(data, indent=2 if indent else None, sort_keys=True).encode("utf-8")
+
+
 def _write_json(path: Path, data: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    _ensure_dir(path.parent)
+    path.write_bytes(_dumps(data, indent=True))
 
 
-def _append_jsonl(path: Path, data: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(data, sort_keys=True))
-        f.write("\n")
+def _append_jsonl(handle: BinaryIO, data: Dict[str, Any]) -> None:
+    handle.write(_dumps(data))
+    handle.write(b"\n")
 
 
-def _run_go_shim(go_cmd: str, corpus: Path, scenario_id: str) -> Optional[Dict[str, Any]]:
-    cmd = [
-        go_cmd,
-        "run",
-        str(Path("validation/go/validators/epoch_fork/main.go")),
-        "--corpus",
-        str(corpus),
-        "--scenario",
-        scenario_id,
-    ]
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if proc.returncode != 0:
-        sys.stderr.write(proc.stderr)
-        return None
-    try:
-        return json.loads(proc.stdout.splitlines()[0])
-    except json.JSONDecodeError:
-        sys.stderr.write("Failed to parse Go shim output\n")
-        return None
+def _go_shim_cmd(go_cmd: str, corpus: Path) -> List[str]:
+    return [go_cmd, "run", str(Path("validation/go/validators/epoch_fork/main.go")), "--corpus", str(corpus), "--daemon"]
 
 
-def _run_node_shim(node_cmd: str, corpus: Path, scenario_id: str) -> Optional[Dict[str, Any]]:
-    cmd = [
-        node_cmd,
-        str(Path("validation/nodejs/validators/epoch_fork.js")),
-        "--corpus",
-        str(corpus),
-        "--scenario",
-        scenario_id,
-    ]
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if proc.returncode != 0:
-        sys.stderr.write(proc.stderr)
-        return None
-    lines = [ln for ln in proc.stdout.splitlines() if ln.strip()]
-    if not lines:
-        return None
-    try:
-        return json.loads(lines[0])
-    except json.JSONDecodeError:
-        sys.stderr.write("Failed to parse Node shim output\n")
-        return None
+def _node_shim_cmd(node_cmd: str, corpus: Path) -> List[str]:
+    return [node_cmd, str(Path("validation/nodejs/validators/epoch_fork.js")), "--corpus", str(corpus), "--daemon"]
 
 
-def _run_rust_shim(cargo_cmd: str, corpus: Path, scenario_id: str) -> Optional[Dict[str, Any]]:
-    cmd = [
+def _rust_shim_cmd(cargo_cmd: str, corpus: Path) -> List[str]:
+    return [
         cargo_cmd,
         "run",
         "--quiet",
@@ -92,29 +82,58 @@ def _run_rust_shim(cargo_cmd: str, corpus: Path, scenario_id: str) -> Optional[D
         "--",
         "--corpus",
         str(corpus),
-        "--scenario",
-        scenario_id,
+        "--daemon",
     ]
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    if proc.returncode != 0:
-        sys.stderr.write(proc.stderr)
-        return None
-    lines = [ln for ln in proc.stdout.splitlines() if ln.strip()]
-    if not lines:
-        return None
-    try:
-        return json.loads(lines[0])
-    except json.JSONDecodeError:
-        sys.stderr.write("Failed to parse Rust shim output\n")
-        return None
 
 
-def run_scenario(scenario, language: str = "python") -> Dict[str, Any]:
-    import time
+def _run_shim_daemon(name: str, cmd: List[str], scenario_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Drive one ``--daemon`` shim process over ``scenario_ids``.
+
+    The shim answers each scenario id written to its stdin with one JSON line,
+    so process startup (and the ``go run``/``cargo run`` build) is paid once per
+    corpus instead of once per scenario. Returns one envelope per id, ``None``
+    where the shim reported an error or had already exited.
+    """
+    envelopes: List[Optional[Dict[str, Any]]] = []
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as stderr_log:
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr_log, text=True
+        )
+        assert proc.stdin is not None and proc.stdout is not None
+        for scenario_id in scenario_ids:
+            try:
+                proc.stdin.write(f"{scenario_id}\n")
+                proc.stdin.flush()
+            except BrokenPipeError:
+                break
+            line = proc.stdout.readline()
+            if not line:
+                break
+            try:
+                env = json.loads(line)
+            except json.JSONDecodeError:
+                sys.stderr.write(f"Failed to parse {name} shim output\n")
+                env = None
+            if isinstance(env, dict) and "error" in env:
+                sys.stderr.write(f"{name} shim: {env['error']}\n")
+                env = None
+            envelopes.append(env)
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        if proc.wait() != 0 or len(envelopes) < len(scenario_ids):
+            stderr_log.seek(0)
+            sys.stderr.write(stderr_log.read())
+        proc.stdout.close()
+    envelopes.extend([None] * (len(scenario_ids) - len(envelopes)))
+    return envelopes
+
 
-    start = time.perf_counter()
+def run_scenario(scenario, language: str = "python") -> Dict[str, Any]:
+    start = perf_counter()
     sim_result = simulate(scenario)
-    wall_ms = int((time.perf_counter() - start) * 1000)
+    wall_ms = int((perf_counter() - start) * 1000)
     status, failures = evaluate_expectations(scenario, sim_result)
 
     envelope: Dict[str, Any] = {
@@ -196,31 +215,41 @@ def main(argv: Optional[List[str]] = None) -> int:
         sys.stderr.write("No scenarios matched\n")
         return 1
 
-    envelopes: List[Dict[str, Any]] = []
-    for scenario in selected:
-        env = run_scenario(scenario, language="python")
-        envelopes.append(env)
-        _append_jsonl(args.envelope_out, env)
-        if args.go_shim:
-            go_env = _run_go_shim(args.go_shim, args.corpus, scenario.scenario_id)
-            if go_env:
-                go_env.setdefault("language", "go")
-                envelopes.append(go_env)
-                _append_jsonl(args.envelope_out, go_env)
-        if args.node_shim:
-            node_env = _run_node_shim(args.node_shim, args.corpus, scenario.scenario_id)
-            if node_env:
-                node_env.setdefault("language", "nodejs")
-                envelopes.append(node_env)
-                _append_jsonl(args.envelope_out, node_env)
-        if args.rust_shim:
-            rust_env = _run_rust_shim(args.rust_shim, args.corpus, scenario.scenario_id)
-            if rust_env:
-                rust_env.setdefault("language", "rust")
-                envelopes.append(rust_env)
-                _append_jsonl(args.envelope_out, rust_env)
-
-    summary = build_summary("python", [e for e in envelopes if e.get("language") == "python"])
+    shims = [
+        (cmd, build_cmd, name, language)
+        for cmd, build_cmd, name, language in (
+            (args.go_shim, _go_shim_cmd, "Go", "go"),
+            (args.node_shim, _node_shim_cmd, "Node", "nodejs"),
+            (args.rust_shim, _rust_shim_cmd, "Rust", "rust"),
+        )
+        if cmd
+    ]
+
+    # Python envelopes are computed before any shim starts so their wall_time_ms
+    # is not skewed by shim compiles running on the same cores.
+    python_envs = [run_scenario(scenario, language="python") for scenario in selected]
+    # Each shim is one long-lived process fed every scenario id; the shims are
+    # independent, so they run concurrently, one thread each.
+    scenario_ids = [scenario.scenario_id for scenario in selected]
+    with ThreadPoolExecutor(max_workers=max(len(shims), 1)) as pool:
+        futures = [
+            pool.submit(_run_shim_daemon, name, build_cmd(cmd, args.corpus), scenario_ids)
+            for cmd, build_cmd, name, _ in shims
+        ]
+        shim_envs = [future.result() for future in futures]
+
+    # Written in scenario/shim order so the envelope log stays deterministic
+    _ensure_dir(args.envelope_out.parent)
+    with args.envelope_out.open("ab", buffering=1 << 16) as envelope_log:
+        for idx, env in enumerate(python_envs):
+            _append_jsonl(envelope_log, env)
+            for (_, _, _, language), envs in zip(shims, shim_envs):
+                shim_env = envs[idx]
+                if shim_env:
+                    shim_env.setdefault("language", language)
+                    _append_jsonl(envelope_log, shim_env)
+
+    summary = build_summary("python", python_envs)
     _write_json(args.summary_out, summary)
     return 0
 
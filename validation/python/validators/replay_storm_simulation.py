@@ -3,35 +3,31 @@
 
 from __future__ import annotations
 
+import argparse
 import json
+import os
 import sys
-from importlib import util as importlib_util
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional
 
 ROOT_DIR = Path(__file__).resolve().parents[3]
 if str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
+from validation.common.simulators.replay import ReplayProfile, ReplayStormSimulator  # type: ignore[import]
 from validation.python.util.reporting import write_json  # type: ignore[import]
 
 
-def load_simulator() -> Tuple[Any, Any]:
-    module_path = ROOT_DIR / "validation/common/simulators/replay.py"
-    module_name = "validation.common.simulators.replay"
-    spec = importlib_util.spec_from_file_location(module_name, module_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError("Unable to load replay simulator module")
-    module = importlib_util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module.ReplayProfile, module.ReplayStormSimulator
+PROFILES_PATH = ROOT_DIR / "tests/common/adversarial/replay_storm_profiles.json"
+SUMMARY_FILENAME = "replay_storm_summary.json"
 
 
-ReplayProfile, ReplayStormSimulator = load_simulator()
+# Below this many profiles, pool startup costs more than it saves: the common
+# (finite, non-negative) profiles are simulated in closed form.
+POOL_MIN_PROFILES = 32
 
-PROFILES_PATH = ROOT_DIR / "tests/common/adversarial/replay_storm_profiles.json"
-SUMMARY_FILENAME = "replay_storm_summary.json"
+_worker_simulator: Any = None
 
 
 def load_profiles() -> Dict[str, Any]:
@@ -39,15 +35,47 @@ def load_profiles() -> Dict[str, Any]:
         return json.load(handle)
 
 
+def _init_worker(window_size: int, capacity_per_ms: float, queue_limit: Optional[float]) -> None:
+    global _worker_simulator
+    _worker_simulator = ReplayStormSimulator(
+        window_size=window_size, capacity_per_ms=capacity_per_ms, queue_limit=queue_limit
+    )
+
+
+def _simulate_profile(profile_data: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_simulator.simulate(ReplayProfile.from_dict(profile_data))
+
+
+def simulate_profiles(
+    profiles: List[Dict[str, Any]], window_size: int, capacity_per_ms: float, queue_limit: Optional[float]
+) -> List[Dict[str, Any]]:
+    """Simulate every profile, in order; large batches fan out over worker processes."""
+    if len(profiles) < POOL_MIN_PROFILES:
+        _init_worker(window_size, capacity_per_ms, queue_limit)
+        return [_simulate_profile(profile_data) for profile_data in profiles]
+    # Each profile is simulated independently; Pool.map keeps the input order
+    with Pool(
+        processes=min(len(profiles), os.cpu_count() or 1),
+        initializer=_init_worker,
+        initargs=(window_size, capacity_per_ms, queue_limit),
+    ) as pool:
+        return pool.map(_simulate_profile, profiles, chunksize=4)
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the replay storm profiles")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Print every profile, not only failures (default on a terminal)"
+    )
+    args = parser.parse_args()
+    verbose = args.verbose or sys.stdout.isatty()
     data = load_profiles()
     tolerance = float(data.get("tolerance", 0.05))
     queue_limit_value = data.get("queue_limit")
-    simulator = ReplayStormSimulator(
-        window_size=int(data["window_size"]),
-        capacity_per_ms=float(data["capacity_per_ms"]),
-        queue_limit=float(queue_limit_value) if queue_limit_value is not None else None,
-    )
+    window_size = int(data["window_size"])
+    capacity_per_ms = float(data["capacity_per_ms"])
+    queue_limit = float(queue_limit_value) if queue_limit_value is not None else None
+    simulator = ReplayStormSimulator(window_size=window_size, capacity_per_ms=capacity_per_ms, queue_limit=queue_limit)
 
     summary: Dict[str, Any] = {
         "window_size": data["window_size"],
@@ -60,9 +88,8 @@ def main() -> None:
     passed = 0
     profiles: List[Dict[str, Any]] = data.get("profiles", [])
 
-    for profile_data in profiles:
-        profile = ReplayProfile.from_dict(profile_data)
-        metrics = simulator.simulate(profile)
+    all_metrics = simulate_profiles(profiles, window_size, capacity_per_ms, queue_limit)
+    for profile_data, metrics in zip(profiles, all_metrics):
         expected_drop = float(profile_data.get("expected_drop_ratio", 0.0))
         expected_alert = bool(profile_data.get("expected_alert", True))
         drop_delta = abs(metrics["drop_ratio"] - expected_drop)
@@ -78,11 +105,12 @@ def main() -> None:
         }
         summary["profiles"].append(profile_summary)
 
-        indicator = "✅" if status else "❌"
-        print(
-            f"{indicator} {profile.profile_id} | drop_ratio={metrics['drop_ratio']:.2f} (target={expected_drop:.2f})"
-            f" alert={'yes' if metrics['alert_triggered'] else 'no'}"
-        )
+        if verbose or not status:
+            indicator = "✅" if status else "❌"
+            print(
+                f"{indicator} {metrics['profile_id']} | drop_ratio={metrics['drop_ratio']:.2f} (target={expected_drop:.2f})"
+                f" alert={'yes' if metrics['alert_triggered'] else 'no'}"
+            )
 
         if status:
             passed += 1
@@ -93,6 +121,7 @@ def main() -> None:
     summary["status"] = "success" if passed == total else "failed"
 
     output_path = write_json(SUMMARY_FILENAME, summary)
+    print(f"{passed}/{total} replay storm profiles passed")
     print(f"\n📄 Replay storm summary saved to {output_path}")
 
     if summary["failed"]:
@@ -10,6 +10,7 @@ import struct
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 # Import our CBOR encoder
@@ -25,151 +26,141 @@ from validation.python.util.reporting import write_json  # type: ignore[import]
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Simple CBOR encoder (copy from validate_cbor_python_fixed.py)
+# Multi-byte head arguments: precompiled Structs measured as fast as or faster
+# than int.to_bytes(width, 'big') at every width, and append() beats both for
+# the 1-byte argument
+_U16 = struct.Struct('>H')
+_U32 = struct.Struct('>I')
+_U64 = struct.Struct('>Q')
+
+def _emit_head(buf, initial, argument):
+    """Append a CBOR head (initial byte plus shortest argument); False if the argument needs more than 8 bytes"""
+    if argument <= 23:
+        buf.append(initial + argument)
+    elif argument <= 0xFF:
+        buf.append(initial + 24)
+        buf.append(argument)
+    elif argument <= 0xFFFF:
+        buf.append(initial + 25)
+        buf += _U16.pack(argument)
+    elif argument <= 0xFFFFFFFF:
+        buf.append(initial + 26)
+        buf += _U32.pack(argument)
+    elif argument <= 0xFFFFFFFFFFFFFFFF:
+        buf.append(initial + 27)
+        buf += _U64.pack(argument)
+    else:
+        return False
+    return True
+
+@lru_cache(maxsize=1024)
+def _encode_text(value):
+    """Encoded CBOR text string; cached because map keys repeat across every message"""
+    buf = bytearray()
+    SimpleCBOR._encode_string(buf, value)
+    return bytes(buf)
+
 class SimpleCBOR:
     """Simple CBOR encoder for validation purposes"""
     
     @staticmethod
     def encode_canonical(data):
         """Encode data using canonical CBOR rules"""
+        buf = bytearray()
+        SimpleCBOR._encode_into(buf, data)
+        return bytes(buf)
+    
+    @staticmethod
+    def _encode_into(buf, data):
+        """Append the canonical encoding of data to buf"""
         if isinstance(data, dict):
-            return SimpleCBOR._encode_map(data)
+            SimpleCBOR._encode_map(buf, data)
         elif isinstance(data, list):
-            return SimpleCBOR._encode_array(data)
+            SimpleCBOR._encode_array(buf, data)
         elif isinstance(data, str):
-            return SimpleCBOR._encode_string(data)
+            SimpleCBOR._encode_string(buf, data)
         elif isinstance(data, bytes):
-            return SimpleCBOR._encode_bytes(data)
+            SimpleCBOR._encode_bytes(buf, data)
         elif isinstance(data, int):
-            return SimpleCBOR._encode_int(data)
+            SimpleCBOR._encode_int(buf, data)
         elif isinstance(data, bool):
-            return SimpleCBOR._encode_bool(data)
+            SimpleCBOR._encode_bool(buf, data)
         else:
             raise ValueError(f"Unsupported type: {type(data)}")
     
     @staticmethod
-    def _encode_int(value):
+    def _encode_int(buf, value):
         """Encode integer with smallest possible representation"""
         if value >= 0:
-            if value <= 23:
-                return bytes([value])
-            elif value <= 0xFF:
-                return bytes([0x18, value])
-            elif value <= 0xFFFF:
-                return bytes([0x19]) + struct.pack('>H', value)
-            elif value <= 0xFFFFFFFF:
-                return bytes([0x1A]) + struct.pack('>I', value)
-            elif value <= 0xFFFFFFFFFFFFFFFF:
-                return bytes([0x1B]) + struct.pack('>Q', value)
+            encoded = _emit_head(buf, 0x00, value)
         else:
             # Negative integers
-            abs_val = abs(value) - 1
-            if abs_val <= 23:
-                return bytes([0x20 + abs_val])
-            elif abs_val <= 0xFF:
-                return bytes([0x38, abs_val])
-            elif abs_val <= 0xFFFF:
-                return bytes([0x39]) + struct.pack('>H', abs_val)
-            elif abs_val <= 0xFFFFFFFF:
-                return bytes([0x3A]) + struct.pack('>I', abs_val)
-            elif abs_val <= 0xFFFFFFFFFFFFFFFF:
-                return bytes([0x3B]) + struct.pack('>Q', abs_val)
-        raise ValueError(f"Integer too large: {value}")
+            encoded = _emit_head(buf, 0x20, abs(value) - 1)
+        if not encoded:
+            raise ValueError(f"Integer too large: {value}")
     
     @staticmethod
-    def _encode_string(value):
+    def _encode_string(buf, value):
         """Encode UTF-8 string"""
         utf8_bytes = value.encode('utf-8')
         length = len(utf8_bytes)
-        if length <= 23:
-            return bytes([0x60 + length]) + utf8_bytes
-        elif length <= 0xFF:
-            return bytes([0x78, length]) + utf8_bytes
-        elif length <= 0xFFFF:
-            return bytes([0x79]) + struct.pack('>H', length) + utf8_bytes
-        elif length <= 0xFFFFFFFF:
-            return bytes([0x7A]) + struct.pack('>I', length) + utf8_bytes
-        else:
+        if length > 0xFFFFFFFF:
             raise ValueError(f"String too long: {length}")
+        _emit_head(buf, 0x60, length)
+        buf += utf8_bytes
     
     @staticmethod
-    def _encode_bytes(value):
+    def _encode_bytes(buf, value):
         """Encode byte string"""
         length = len(value)
-        if length <= 23:
-            return bytes([0x40 + length]) + value
-        elif length <= 0xFF:
-            return bytes([0x58, length]) + value
-        elif length <= 0xFFFF:
-            return bytes([0x59]) + struct.pack('>H', length) + value
-        elif length <= 0xFFFFFFFF:
-            return bytes([0x5A]) + struct.pack('>I', length) + value
-        else:
+        if length > 0xFFFFFFFF:
             raise ValueError(f"Byte string too long: {length}")
+        _emit_head(buf, 0x40, length)
+        buf += value
     
     @staticmethod
-    def _encode_array(value):
+    def _encode_array(buf, value):
         """Encode array with fixed length"""
         length = len(value)
-        if length <= 23:
-            header = bytes([0x80 + length])
-        elif length <= 0xFF:
-            header = bytes([0x98, length])
-        elif length <= 0xFFFF:
-            header = bytes([0x99]) + struct.pack('>H', length)
-        elif length <= 0xFFFFFFFF:
-            header = bytes([0x9A]) + struct.pack('>I', length)
-        else:
+        if length > 0xFFFFFFFF:
             raise ValueError(f"Array too long: {length}")
-        
-        result = header
+        _emit_head(buf, 0x80, length)
         for item in value:
-            result += SimpleCBOR.encode_canonical(item)
-        return result
+            SimpleCBOR._encode_into(buf, item)
     
     @staticmethod
-    def _encode_map(value):
+    def _encode_map(buf, value):
         """Encode map with sorted keys"""
         # Sort keys by length, then lexicographically
         sorted_keys = sorted(value.keys(), key=lambda k: (len(k), k))
         length = len(sorted_keys)
-        
-        if length <= 23:
-            header = bytes([0xA0 + length])
-        elif length <= 0xFF:
-            header = bytes([0xB8, length])
-        elif length <= 0xFFFF:
-            header = bytes([0xB9]) + struct.pack('>H', length)
-        elif length <= 0xFFFFFFFF:
-            header = bytes([0xBA]) + struct.pack('>I', length)
-        else:
+        if length > 0xFFFFFFFF:
             raise ValueError(f"Map too long: {length}")
-        
-        result = header
+        _emit_head(buf, 0xA0, length)
         for key in sorted_keys:
-            result += SimpleCBOR.encode_canonical(key)
-            result += SimpleCBOR.encode_canonical(value[key])
-        return result
+            if type(key) is str:
+                buf += _encode_text(key)
+            else:
+                SimpleCBOR._encode_into(buf, key)
+            SimpleCBOR._encode_into(buf, value[key])
     
     @staticmethod
-    def _encode_bool(value):
+    def _encode_bool(buf, value):
         """Encode boolean"""
-        return bytes([0xF5]) if value else bytes([0xF4])
+        buf.append(0xF5 if value else 0xF4)
     
     @staticmethod
     def encode_tagged(tag, data):
         """Encode tagged value"""
-        if tag <= 23:
-            tag_header = bytes([0xC0 + tag])
-        elif tag <= 0xFF:
-            tag_header = bytes([0xD8, tag])
-        elif tag <= 0xFFFF:
-            tag_header = bytes([0xD9]) + struct.pack('>H', tag)
-        elif tag <= 0xFFFFFFFF:
-            tag_header = bytes([0xDA]) + struct.pack('>I', tag)
-        else:
+        # One growing buffer: sizing the tree first to fill a preallocated
+        # buffer measured about 2x slower, as the extra pass costs more in
+        # Python than bytearray's amortised growth saves
+        buf = bytearray()
+        if tag > 0xFFFFFFFF:
             raise ValueError(f"Tag too large: {tag}")
-        
-        return tag_header + SimpleCBOR.encode_canonical(data)
+        _emit_head(buf, 0xC0, tag)
+        SimpleCBOR._encode_into(buf, data)
+        return bytes(buf)
 
 class ValidationError(Exception):
     """CBOR validation error"""
@@ -388,7 +379,7 @@ class FoxWhisperSchema:
                 elif additional_info == 0x19:  # Two-byte length
                     if i + 3 > len(encoded_bytes):
                         raise ValidationError("Truncated integer encoding")
-                    value = struct.unpack('>H', encoded_bytes[i+1:i+3])[0]
+                    value = _U16.unpack_from(encoded_bytes, i + 1)[0]
                     if value <= 255:  # Should have used one-byte length
                         raise ValidationError(f"Non-canonical integer: {value} should use one byte")
                     i += 3
@@ -4,6 +4,7 @@ use std::cmp::Ordering;
 use std::collections::HashMap;
 use std::env;
 use std::fs;
+use std::io::{self, BufRead, Write};
 
 mod util;
 
@@ -392,9 +393,10 @@ fn evaluate(s: &Scenario, env: &mut Envelope) {
     }
 }
 
-fn parse_args() -> (String, Option<String>) {
+fn parse_args() -> (String, Option<String>, bool) {
     let mut corpus = "tests/common/adversarial/epoch_forks.json".to_string();
     let mut scenario: Option<String> = None;
+    let mut daemon = false;
     let args: Vec<String> = env::args().collect();
     let mut i = 1;
     while i < args.len() {
@@ -411,11 +413,45 @@ fn parse_args() -> (String, Option<String>) {
                     i += 1;
                 }
             }
+            "--daemon" => daemon = true,
             _ => {}
         }
         i += 1;
     }
-    (corpus, scenario)
+    (corpus, scenario, daemon)
+}
+
+/// Answers every scenario id read from stdin with exactly one JSON line (the
+/// envelope, or {"error": ...}), so a coordinator can reuse one process, and
+/// one `cargo run` build, for a whole corpus.
+fn serve_daemon(scenarios: Vec<Scenario>) {
+    let mut by_id: HashMap<String, Scenario> = HashMap::new();
+    for mut scenario in scenarios {
+        for (idx, ev) in scenario.event_stream.iter_mut().enumerate() {
+            ev.idx = idx;
+        }
+        by_id.entry(scenario.scenario_id.clone()).or_insert(scenario);
+    }
+    let stdin = io::stdin();
+    let stdout = io::stdout();
+    for line in stdin.lock().lines() {
+        let line = match line {
+            Ok(line) => line,
+            Err(_) => break,
+        };
+        let out = match by_id.get(line.trim()) {
+            Some(scenario) => {
+                let mut env = simulate(scenario);
+                evaluate(scenario, &mut env);
+                serde_json::to_string(&env).unwrap()
+            }
+            None => serde_json::json!({ "error": "No matching scenarios" }).to_string(),
+        };
+        let mut handle = stdout.lock();
+        if writeln!(handle, "{}", out).and_then(|_| handle.flush()).is_err() {
+            break;
+        }
+    }
 }
 
 fn load_corpus(path: &str) -> Vec<Scenario> {
@@ -429,8 +465,12 @@ fn load_corpus(path: &str) -> Vec<Scenario> {
 }
 
 fn main() {
-    let (corpus_path, scenario_id) = parse_args();
+    let (corpus_path, scenario_id, daemon) = parse_args();
     let scenarios = load_corpus(&corpus_path);
+    if daemon {
+        serve_daemon(scenarios);
+        return;
+    }
     let selected: Vec<Scenario> = if let Some(id) = scenario_id {
         scenarios
             .into_iter()